@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """
-Clean image_metadata.json by removing entries where:
+Clean the stored image metadata (image_metadata.jsonl) by removing entries where:
 1. thumbnail is the same as source_link
 2. Both title and extra_text are missing (empty strings or None)
 """
 
-import json
 from pathlib import Path
 
+try:
+    from scripts.image_metadata_store import (
+        LEGACY_METADATA_FILENAME, METADATA_FILENAME, export_json, load_all, rewrite_metadata,
+    )
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        LEGACY_METADATA_FILENAME, METADATA_FILENAME, export_json, load_all, rewrite_metadata,
+    )
+
 
 def is_empty(value):
     """Check if a value is empty (None, empty string, or whitespace only)"""
@@ -37,11 +45,11 @@ def should_remove_entry(entry):
 
 
 def main():
-    metadata_path = Path(__file__).parent.parent / "images" / "image_metadata.json"
+    output_dir = Path(__file__).parent.parent / "images"
+    metadata_path = output_dir / METADATA_FILENAME
     
     print(f"Loading {metadata_path}...")
-    with open(metadata_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_all(output_dir)
     
     original_count = len(data)
     print(f"Original entries: {original_count}")
@@ -55,8 +63,13 @@ def main():
     
     # Save cleaned data
     print(f"Saving cleaned data to {metadata_path}...")
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
+    rewrite_metadata(output_dir, cleaned_data)
+    
+    # Keep the JSON array export in step for readers that still use it
+    legacy_path = output_dir / LEGACY_METADATA_FILENAME
+    if legacy_path.exists():
+        print(f"Refreshing {legacy_path}...")
+        export_json(output_dir)
     
     print("Done!")
 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+driver_pool.py
+Pool of idle Selenium WebDrivers shared by the scrape_images_meta_* scripts.
+
+Drivers are keyed by the factory that built them and its arguments, so each
+script keeps its own browser options while reusing warm browsers between
+scrapes. Idle drivers are quit when the interpreter exits.
+"""
+
+import atexit
+import logging
+import queue
+
+# Idle drivers keyed by (factory, factory arguments)
+_DRIVER_POOL = {}
+
+
+def _driver_is_alive(driver) -> bool:
+    """Return True if the driver's browser session still responds."""
+    if driver.session_id is None:
+        return False
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _quit_quietly(driver) -> None:
+    """Quit a driver, ignoring errors from an already dead browser."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def get_pooled_driver(factory, *args):
+    """Check out an idle driver built by factory(*args), starting a new one if none is idle."""
+    pool = _DRIVER_POOL.setdefault((factory, args), queue.Queue())
+    while True:
+        try:
+            driver = pool.get_nowait()
+        except queue.Empty:
+            return factory(*args)
+        if _driver_is_alive(driver):
+            return driver
+        logging.debug("Discarding dead pooled driver")
+        _quit_quietly(driver)
+
+
+def release_pooled_driver(driver, factory, *args) -> None:
+    """Reset a driver from get_pooled_driver(factory, *args) and return it to the pool."""
+    try:
+        # Keep only the first tab open
+        for handle in driver.window_handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception as e:
+        logging.debug(f"Failed to reset driver, closing it: {e}")
+        _quit_quietly(driver)
+        return
+    _DRIVER_POOL.setdefault((factory, args), queue.Queue()).put(driver)
+
+
+def shutdown_driver_pool() -> None:
+    """Quit every idle pooled driver."""
+    for pool in _DRIVER_POOL.values():
+        while True:
+            try:
+                driver = pool.get_nowait()
+            except queue.Empty:
+                break
+            _quit_quietly(driver)
+
+
+atexit.register(shutdown_driver_pool)
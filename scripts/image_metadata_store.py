@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+image_metadata_store.py
+Shared storage for the image metadata collected by the scrape_images_meta_* scripts.
+
+Every scraper appends to image_metadata.jsonl (one JSON object per line) in the
+output directory. The older image_metadata.json array is merged into it whenever
+that file has changed since the JSONL was last written, and can be regenerated
+from the JSONL with export_json for consumers that still read a JSON array.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+# Metadata is stored as JSON Lines so new entries can be appended
+METADATA_FILENAME = "image_metadata.jsonl"
+# Previous single-array format, merged into the JSONL and exported on request
+LEGACY_METADATA_FILENAME = "image_metadata.json"
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_indented(obj) -> bytes:
+    """Encode obj as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def json_line(obj) -> bytes:
+    """Encode obj as one UTF-8 JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data via a temp file so a crash never truncates path."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def thumbnail_key(item: dict):
+    """Default dedup key for a metadata entry: its thumbnail URL."""
+    return item.get("thumbnail")
+
+
+def iter_metadata(metadata_path: Path):
+    """Yield metadata entries from a JSON Lines file one at a time."""
+    with open(metadata_path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json_loads(line)
+
+
+def load_all(output_dir: Path) -> list:
+    """Load every stored metadata entry from output_dir as a list."""
+    metadata_path = migrate_legacy_metadata(output_dir)
+    if not metadata_path.exists():
+        return []
+    return list(iter_metadata(metadata_path))
+
+
+def _mark_legacy_merged(legacy_path: Path, metadata_path: Path) -> None:
+    """Give the legacy file the JSONL's mtime so it is not merged again until it changes."""
+    legacy_stat = legacy_path.stat()
+    os.utime(legacy_path, ns=(legacy_stat.st_atime_ns, metadata_path.stat().st_mtime_ns))
+
+
+def migrate_legacy_metadata(output_dir: Path) -> Path:
+    """
+    Merge a legacy image_metadata.json list into image_metadata.jsonl.
+
+    Runs whenever the legacy file is newer than the JSONL, so entries written
+    to it after an earlier migration are picked up too. Entries whose thumbnail
+    (or, without one, whose whole record) is already stored are skipped; the
+    legacy file is left in place. Returns the JSONL path.
+    """
+    metadata_path = output_dir / METADATA_FILENAME
+    legacy_path = output_dir / LEGACY_METADATA_FILENAME
+    if not legacy_path.exists():
+        return metadata_path
+    if metadata_path.exists() and metadata_path.stat().st_mtime_ns >= legacy_path.stat().st_mtime_ns:
+        return metadata_path
+
+    try:
+        legacy_metadata = json_loads(legacy_path.read_bytes())
+        stored = set()
+        if metadata_path.exists():
+            for item in iter_metadata(metadata_path):
+                if isinstance(item, dict):
+                    stored.add(thumbnail_key(item) or json_line(item))
+
+        missing = []
+        for item in legacy_metadata:
+            if not isinstance(item, dict):
+                continue
+            key = thumbnail_key(item) or json_line(item)
+            if key not in stored:
+                stored.add(key)
+                missing.append(item)
+
+        with open(metadata_path, "ab") as f:
+            f.write(b"".join(json_line(item) for item in missing))
+        _mark_legacy_merged(legacy_path, metadata_path)
+        if missing:
+            logging.info("Merged %d entries from %s into %s", len(missing), legacy_path, metadata_path)
+    except Exception as exc:
+        logging.warning("Failed to merge legacy metadata JSON: %s", exc)
+    return metadata_path
+
+
+def append_metadata(output_dir: Path, entries: list) -> Path:
+    """Append entries to image_metadata.jsonl without reading it; returns the JSONL path."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metadata_path = migrate_legacy_metadata(output_dir)
+    with open(metadata_path, "ab") as f:
+        f.write(b"".join(json_line(entry) for entry in entries))
+    return metadata_path
+
+
+def append_new_metadata(output_dir: Path, collected_metadata: list, key=thumbnail_key) -> list:
+    """
+    Append the collected entries that are not stored yet; returns them.
+
+    Entries are deduplicated by key(entry) against the stored metadata and
+    within collected_metadata; entries without a key are always appended.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metadata_path = migrate_legacy_metadata(output_dir)
+    existing_keys = set()
+
+    if metadata_path.exists():
+        try:
+            # Entries are always dicts; a corrupted line lands in the except below
+            existing_keys = {k for k in map(key, iter_metadata(metadata_path)) if k}
+            logging.info("Loaded %d existing metadata keys", len(existing_keys))
+        except Exception as exc:
+            logging.warning("Failed to read existing metadata JSONL: %s", exc)
+            existing_keys = set()
+
+    new_metadata_entries = []
+    for meta in collected_metadata:
+        meta_key = key(meta)
+        if meta_key:
+            if meta_key in existing_keys:
+                continue
+            existing_keys.add(meta_key)
+        new_metadata_entries.append(meta)
+
+    # Append only the new entries instead of rewriting the whole file
+    try:
+        append_metadata(output_dir, new_metadata_entries)
+        logging.info("Saved metadata for %d new entries to %s", len(new_metadata_entries), metadata_path)
+    except Exception as exc:
+        logging.warning("Failed to save metadata JSONL: %s", exc)
+    return new_metadata_entries
+
+
+def rewrite_metadata(output_dir: Path, entries: list) -> Path:
+    """Replace the contents of image_metadata.jsonl with entries; returns the JSONL path."""
+    metadata_path = output_dir / METADATA_FILENAME
+    write_bytes_atomic(metadata_path, b"".join(json_line(entry) for entry in entries))
+    return metadata_path
+
+
+def export_json(output_dir: Path, json_path: Path = None) -> int:
+    """
+    Write every stored entry to json_path as one JSON array; returns the count.
+
+    json_path defaults to the legacy image_metadata.json next to the JSONL.
+    Rows other writers added to that file are merged into the JSONL first
+    (deduplicated by thumbnail), so replacing it never drops them.
+    """
+    metadata_path = migrate_legacy_metadata(output_dir)
+    legacy_path = output_dir / LEGACY_METADATA_FILENAME
+    json_path = Path(json_path) if json_path else legacy_path
+    entries = list(iter_metadata(metadata_path)) if metadata_path.exists() else []
+    write_bytes_atomic(json_path, json_dumps_indented(entries))
+    if metadata_path.exists() and json_path.resolve() == legacy_path.resolve():
+        # The export holds nothing the JSONL lacks, so don't merge it back
+        _mark_legacy_merged(legacy_path, metadata_path)
+    return len(entries)
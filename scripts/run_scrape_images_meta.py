@@ -11,7 +11,7 @@ import logging
 from pathlib import Path
 from time import sleep
 
-from scrape_images_meta_bymarketers import scrape_images_with_js
+from scrape_images_meta_bymarketers import METADATA_FILENAME, scrape_images_with_js
 from scrape_urls_google import WINDSOR_TEMPLATE_PAGES
 
 
@@ -23,7 +23,7 @@ def parse_args() -> argparse.Namespace:
         "--output-dir",
         "-o",
         default="images",
-        help="Directory containing image_metadata.json (default: images/).",
+        help="Directory containing image_metadata.jsonl (default: images/).",
     )
     parser.add_argument(
         "--wait-time",
@@ -88,7 +88,7 @@ def main() -> None:
             sleep(args.delay)
 
     logging.info("Batch complete. Total new metadata entries: %d", total_new_entries)
-    logging.info("Metadata stored in: %s", (output_dir / "image_metadata.json").resolve())
+    logging.info("Metadata stored in: %s", (output_dir / METADATA_FILENAME).resolve())
 
 
 if __name__ == "__main__":
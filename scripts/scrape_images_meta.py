@@ -5,7 +5,6 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
 import logging
 import os
 import re
@@ -18,6 +17,15 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 
+try:
+    from scripts.image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata,
+    )
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata,
+    )
+
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
     """Setup Chrome WebDriver with options."""
@@ -358,46 +366,7 @@ def scrape_images_with_js(
     new_metadata_entries = []
     
     if collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
-        
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
-            except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
-        
-        combined_metadata = list(existing_metadata)
-        for meta in collected_metadata:
-            url = meta.get("thumbnail")
-            if url and url in existing_urls:
-                continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
-            new_metadata_entries.append(meta)
-        
-        try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
-            logging.info(
-                "Saved metadata for %d new images (total %d) to %s",
-                len(new_metadata_entries),
-                len(combined_metadata),
-                metadata_path,
-            )
-        except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
+        new_metadata_entries = append_new_metadata(output_dir, collected_metadata)
     else:
         logging.info("No additional metadata collected for images.")
     
@@ -467,7 +436,7 @@ def main():
     print(f"{'='*60}")
     print(f"Collected image metadata from page")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
@@ -5,11 +5,12 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
 import logging
 import os
+import queue
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
@@ -18,6 +19,46 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 
+try:
+    from scripts.image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata,
+    )
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata,
+    )
+
+# Resources the scraper never renders; blocked to cut page load time
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.css',
+]
+
+AUTHOR_CLASS_RE = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+DASHBOARD_CARD_SELECTOR = "div[class*='DashboardReportCard_cardWrap']"
+# Serialize only the main content region instead of the whole document, unless
+# there is no <main> or the dashboard cards are outside it
+RESULTS_HTML_JS = (
+    "var main = document.querySelector('main');"
+    "return (main && main.querySelector(arguments[0]) ? main : document.documentElement).outerHTML;"
+)
+PAGINATION_CANDIDATES_JS = """
+return Array.from(document.querySelectorAll('button, a')).map(function(e, i) {
+    return {
+        index: i,
+        tag: e.tagName.toLowerCase(),
+        text: (e.innerText || '').trim(),
+        label: e.getAttribute('aria-label') || '',
+        visible: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length),
+        enabled: e.disabled !== true
+    };
+});
+"""
+PAGINATION_ELEMENTS_JS = """
+const nodes = document.querySelectorAll('button, a');
+return arguments[0].map(function(i) { return nodes[i]; });
+"""
+
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
     """Setup Chrome WebDriver with options."""
@@ -28,27 +69,60 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--mute-audio')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    
+    # Only the <img> src attributes are needed, so skip downloading images
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
     driver = webdriver.Chrome(options=chrome_options)
+
+    # Block images, stylesheets and fonts at the network layer as well
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.debug(f"Failed to configure request blocking: {e}")
+
     return driver
 
 
 def scroll_page(driver, scroll_pause: float = 2.0, max_scrolls: int = 10):
     """Scroll page to trigger lazy loading."""
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    scrolls = 0
-    
-    while scrolls < max_scrolls:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause)
-        
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            break
-        last_height = new_height
-        scrolls += 1
-        logging.info("Scrolled %d times, page height: %d", scrolls, new_height)
+    # The whole scroll loop runs in the browser and calls back once the page
+    # height stops growing, so it costs a single WebDriver round-trip.
+    script = """
+    const pause = arguments[0];
+    const maxScrolls = arguments[1];
+    const callback = arguments[arguments.length - 1];
+    let scrolls = 0;
+    let lastHeight = document.body.scrollHeight;
+
+    function step() {
+        window.scrollTo(0, document.body.scrollHeight);
+        setTimeout(function() {
+            const height = document.body.scrollHeight;
+            if (height === lastHeight) {
+                callback({scrolls: scrolls, height: height});
+                return;
+            }
+            lastHeight = height;
+            scrolls += 1;
+            if (scrolls >= maxScrolls) {
+                callback({scrolls: scrolls, height: height});
+                return;
+            }
+            step();
+        }, pause);
+    }
+    step();
+    """
+    driver.set_script_timeout(scroll_pause * max_scrolls + 5)
+    result = driver.execute_async_script(script, int(scroll_pause * 1000), max_scrolls)
+    logging.info("Scrolled %d times, page height: %d", result["scrolls"], result["height"])
 
 
 def _get_nearby_text(element, max_chars: int = 240) -> str:
@@ -66,13 +140,12 @@ def _get_nearby_text(element, max_chars: int = 240) -> str:
 
 def _find_author(element):
     """Search ancestor tree for an author/byline-like element."""
-    author_patterns = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
     for ancestor in element.parents:
         if ancestor is None:
             break
         if ancestor.name in ("body", "html"):
             break
-        for candidate in ancestor.find_all(True, class_=author_patterns):
+        for candidate in ancestor.find_all(True, class_=AUTHOR_CLASS_RE):
             text = candidate.get_text(strip=True)
             if text:
                 return text
@@ -188,9 +261,8 @@ def extract_dashboard_metadata(dashboard_card, base_url: str) -> dict:
             srcset = img.get("srcset")
             if srcset:
                 # Extract first URL from srcset
-                srcset_urls = re.findall(r'([^\s,]+)', srcset)
-                if srcset_urls:
-                    src = srcset_urls[0]
+                first = srcset.split(',', 1)[0].strip()
+                src = first.split(None, 1)[0] if first else None
         
         if src:
             metadata["thumbnail"] = urljoin(base_url, src.strip())
@@ -262,61 +334,42 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
 
 def find_pagination_buttons(driver):
     """Find pagination buttons/links on the page."""
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    
-    pagination_buttons = []
+    pagination_buttons = {}
     
     try:
-        # Try to find pagination buttons by various selectors
-        # Common patterns: button with page number, link with page number, etc.
-        wait = WebDriverWait(driver, 10)
+        # Describe every button/link in one script call instead of querying
+        # text, visibility and enabled state element by element
+        candidates = driver.execute_script(PAGINATION_CANDIDATES_JS) or []
         
-        # Try finding buttons or links that contain page numbers
-        # Look for elements that might be pagination controls
-        page_elements = driver.find_elements(By.CSS_SELECTOR, "button, a")
+        for candidate in candidates:
+            text = candidate["text"]
+            # Check if it's a page number (1-9) that is clickable and not disabled
+            if text.isdigit() and 1 <= int(text) <= 9:
+                if candidate["visible"] and candidate["enabled"]:
+                    pagination_buttons.setdefault(int(text), candidate["index"])
         
-        for elem in page_elements:
-            try:
-                text = elem.text.strip()
-                # Check if it's a page number (1-9)
-                if text.isdigit() and 1 <= int(text) <= 9:
-                    # Check if it's clickable and not disabled
-                    if elem.is_displayed() and elem.is_enabled():
-                        page_num = int(text)
-                        pagination_buttons.append((page_num, elem))
-            except:
-                continue
-        
-        # Also try finding by aria-label or data attributes
+        # Also try finding by aria-label (buttons first, then links)
         for page_num in range(1, 10):
-            try:
-                # Try various selectors (note: :contains() is not valid CSS, use XPath instead)
-                selectors = [
-                    f"button[aria-label*='{page_num}']",
-                    f"a[aria-label*='{page_num}']",
-                ]
-                for selector in selectors:
-                    try:
-                        elem = driver.find_element(By.CSS_SELECTOR, selector)
-                        if elem.is_displayed() and elem.is_enabled():
-                            pagination_buttons.append((page_num, elem))
-                            break
-                    except:
-                        continue
-            except:
+            if page_num in pagination_buttons:
                 continue
+            for tag in ("button", "a"):
+                match = next(
+                    (c for c in candidates if c["tag"] == tag and str(page_num) in c["label"]),
+                    None,
+                )
+                if match and match["visible"] and match["enabled"]:
+                    pagination_buttons[page_num] = match["index"]
+                    break
         
-        # Remove duplicates and sort by page number
-        seen = set()
-        unique_buttons = []
-        for page_num, elem in sorted(pagination_buttons, key=lambda x: x[0]):
-            if page_num not in seen:
-                seen.add(page_num)
-                unique_buttons.append((page_num, elem))
+        if not pagination_buttons:
+            return []
         
-        return unique_buttons
+        # Resolve the selected indexes to element handles in a single call
+        page_nums = sorted(pagination_buttons)
+        elements = driver.execute_script(
+            PAGINATION_ELEMENTS_JS, [pagination_buttons[n] for n in page_nums]
+        )
+        return list(zip(page_nums, elements))
     except Exception as e:
         logging.warning(f"Error finding pagination buttons: {e}")
         return []
@@ -340,39 +393,37 @@ def extract_dashboard_items_from_page(soup, base_url):
     return dashboard_items
 
 
-def scrape_images_with_js(
+def _dedupe_items(items: list, seen_urls: set) -> list:
+    """Drop items whose thumbnail/source_link is already in seen_urls, recording new ones."""
+    unique_items = []
+    for meta in items:
+        url = meta.get("thumbnail") or meta.get("source_link")
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        unique_items.append(meta)
+    return unique_items
+
+
+def _scrape_pages_sequential(
     url: str,
-    output_dir: Path,
-    keywords: list = None,
-    headless: bool = True,
-    wait_time: int = 5,
-    scroll: bool = True,
-    total_pages: int = 9,
+    headless: bool,
+    wait_time: int,
+    scroll: bool,
+    total_pages: int,
 ) -> list:
-    """
-    Scrape dashboard items from AgencyAnalytics pages with pagination.
-    
-    Args:
-        url: URL to scrape
-        output_dir: Directory to save metadata
-        keywords: (Unused - kept for backwards compatibility)
-        headless: Run browser in headless mode
-        wait_time: Seconds to wait for JavaScript to load
-        scroll: Whether to scroll page for lazy-loaded images
-        total_pages: Total number of pages to scrape (default: 9)
-    
-    Returns:
-        List of new metadata entries
-    """
+    """Scrape pages 1..total_pages in one browser by clicking pagination buttons."""
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.common.exceptions import TimeoutException
     
     logging.info("Starting browser and loading: %s", url)
     
     driver = setup_driver(headless)
     all_collected_metadata = []
+    seen_urls = set()
     
     try:
         driver.get(url)
@@ -389,59 +440,12 @@ def scrape_images_with_js(
             # If not on first page, try to click pagination button
             if page_num > 1:
                 try:
-                    # Try to find and click the page number button
-                    # The pagination buttons have structure: <button><span class="Button_text__ChhxV">2</span></button>
+                    # Find the page number button; buttons/links that are hidden
+                    # or disabled are already filtered out
                     wait = WebDriverWait(driver, 10)
-                    
-                    # Try multiple strategies to find pagination button
-                    page_button = None
-                    
-                    # Strategy 1: Find button containing span with page number text
-                    # XPath: //button[.//span[contains(@class, 'Button_text') and text()='2']]
-                    try:
-                        page_button = driver.find_element(
-                            By.XPATH, 
-                            f"//button[.//span[contains(@class, 'Button_text') and text()='{page_num}']]"
-                        )
-                    except NoSuchElementException:
-                        # Strategy 2: Find button with class containing "Button_button" that contains span with page number
-                        try:
-                            # Use partial class match since class names might vary
-                            buttons = driver.find_elements(By.CSS_SELECTOR, "button[class*='Button_button']")
-                            for btn in buttons:
-                                try:
-                                    # Find span with Button_text class
-                                    span = btn.find_element(By.CSS_SELECTOR, "span[class*='Button_text']")
-                                    if span.text.strip() == str(page_num):
-                                        page_button = btn
-                                        break
-                                except:
-                                    continue
-                        except NoSuchElementException:
-                            # Strategy 3: Find any button containing the page number text (fallback)
-                            try:
-                                page_button = driver.find_element(By.XPATH, f"//button[contains(text(), '{page_num}')]")
-                            except NoSuchElementException:
-                                # Strategy 4: Find by looking for span with page number and get parent button
-                                try:
-                                    span = driver.find_element(By.XPATH, f"//span[contains(@class, 'Button_text') and text()='{page_num}']")
-                                    page_button = span.find_element(By.XPATH, "./parent::button")
-                                except:
-                                    pass
+                    page_button = dict(find_pagination_buttons(driver)).get(page_num)
                     
                     if page_button:
-                        # Check if button is visible and enabled
-                        if not page_button.is_displayed():
-                            # Scroll to button to ensure it's visible
-                            driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", page_button)
-                            time.sleep(0.5)
-                        
-                        # Check if button is disabled
-                        disabled = page_button.get_attribute("disabled")
-                        if disabled is not None and disabled != "false":
-                            logging.warning("Pagination button for page %d is disabled, skipping", page_num)
-                            continue
-                        
                         # Click the button using JavaScript to avoid interception issues
                         driver.execute_script("arguments[0].click();", page_button)
                         logging.info("Clicked pagination button for page %d", page_num)
@@ -451,7 +455,7 @@ def scrape_images_with_js(
                         
                         # Additional wait for dynamic content to load
                         try:
-                            wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.DashboardReportCard_cardWrap__GpuLE")) > 0)
+                            wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, DASHBOARD_CARD_SELECTOR)) > 0)
                         except:
                             pass
                     else:
@@ -468,11 +472,11 @@ def scrape_images_with_js(
                 scroll_page(driver, scroll_pause=1.0, max_scrolls=3)
             
             # Get page source and parse
-            page_source = driver.page_source
+            page_source = driver.execute_script(RESULTS_HTML_JS, DASHBOARD_CARD_SELECTOR)
             soup = BeautifulSoup(page_source, 'html.parser')
             
             # Extract dashboard items from this page
-            page_items = extract_dashboard_items_from_page(soup, url)
+            page_items = _dedupe_items(extract_dashboard_items_from_page(soup, url), seen_urls)
             all_collected_metadata.extend(page_items)
             
             logging.info("Extracted %d items from page %d (total so far: %d)", 
@@ -483,53 +487,133 @@ def scrape_images_with_js(
     finally:
         driver.quit()
     
+    return all_collected_metadata
+
+
+def _scrape_one_page(driver_pool: queue.Queue, page_url: str, wait_time: int, scroll: bool) -> list:
+    """Load a single page URL with a pooled driver and extract its dashboard items."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
+    driver = driver_pool.get()
+    try:
+        logging.info("Loading: %s", page_url)
+        driver.get(page_url)
+        try:
+            WebDriverWait(driver, wait_time).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, DASHBOARD_CARD_SELECTOR)) > 0
+            )
+        except TimeoutException:
+            logging.warning("No dashboard cards appeared on %s within %d seconds", page_url, wait_time)
+
+        if scroll:
+            scroll_page(driver, scroll_pause=1.0, max_scrolls=3)
+
+        soup = BeautifulSoup(driver.execute_script(RESULTS_HTML_JS, DASHBOARD_CARD_SELECTOR), 'html.parser')
+        return extract_dashboard_items_from_page(soup, page_url)
+    finally:
+        driver_pool.put(driver)
+
+
+def _scrape_pages_parallel(
+    page_url_template: str,
+    headless: bool,
+    wait_time: int,
+    scroll: bool,
+    total_pages: int,
+    workers: int,
+) -> list:
+    """Fetch page URLs built from page_url_template concurrently over a pool of drivers."""
+    workers = max(1, min(workers, total_pages))
+    logging.info("Starting %d browsers for %d pages", workers, total_pages)
+
+    driver_pool = queue.Queue()
+    all_collected_metadata = []
+    seen_urls = set()
+    try:
+        for _ in range(workers):
+            driver_pool.put(setup_driver(headless))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _scrape_one_page,
+                    driver_pool,
+                    page_url_template.format(n=page_num),
+                    wait_time,
+                    scroll,
+                )
+                for page_num in range(1, total_pages + 1)
+            ]
+            # Merge in page order so output matches the sequential scrape
+            for page_num, future in enumerate(futures, start=1):
+                try:
+                    page_items = _dedupe_items(future.result(), seen_urls)
+                except Exception as e:
+                    logging.error(f"Error scraping page {page_num}: {e}")
+                    continue
+                all_collected_metadata.extend(page_items)
+                logging.info("Extracted %d items from page %d (total so far: %d)",
+                           len(page_items), page_num, len(all_collected_metadata))
+    finally:
+        while not driver_pool.empty():
+            driver_pool.get_nowait().quit()
+
+    logging.info("Finished processing all pages. Total items collected: %d", len(all_collected_metadata))
+    return all_collected_metadata
+
+
+def _dashboard_item_key(item: dict):
+    """Dedup key for a dashboard item: its thumbnail, or its link if it has none."""
+    return item.get("thumbnail") or item.get("source_link")
+
+
+def scrape_images_with_js(
+    url: str,
+    output_dir: Path,
+    keywords: list = None,
+    headless: bool = True,
+    wait_time: int = 5,
+    scroll: bool = True,
+    total_pages: int = 9,
+    page_url_template: str = None,
+    workers: int = 4,
+) -> list:
+    """
+    Scrape dashboard items from AgencyAnalytics pages with pagination.
+    
+    Args:
+        url: URL to scrape
+        output_dir: Directory to save metadata
+        keywords: (Unused - kept for backwards compatibility)
+        headless: Run browser in headless mode
+        wait_time: Seconds to wait for JavaScript to load
+        scroll: Whether to scroll page for lazy-loaded images
+        total_pages: Total number of pages to scrape (default: 9)
+        page_url_template: URL with a {n} placeholder for the page number; when
+            given, pages are fetched directly and concurrently instead of clicked
+        workers: Number of browsers to run when page_url_template is set (default: 4)
+    
+    Returns:
+        List of new metadata entries
+    """
+    if page_url_template:
+        all_collected_metadata = _scrape_pages_parallel(
+            page_url_template, headless, wait_time, scroll, total_pages, workers
+        )
+    else:
+        all_collected_metadata = _scrape_pages_sequential(
+            url, headless, wait_time, scroll, total_pages
+        )
+    
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Process and save metadata
     new_metadata_entries = []
     
     if all_collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
-        
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail") or item.get("source_link")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
-            except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
-        
-        combined_metadata = list(existing_metadata)
-        for meta in all_collected_metadata:
-            # Use thumbnail or source_link as unique identifier
-            url = meta.get("thumbnail") or meta.get("source_link")
-            if url and url in existing_urls:
-                continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
-            new_metadata_entries.append(meta)
-        
-        try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
-            logging.info(
-                "Saved metadata for %d new items (total %d) to %s",
-                len(new_metadata_entries),
-                len(combined_metadata),
-                metadata_path,
-            )
-        except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
+        new_metadata_entries = append_new_metadata(output_dir, all_collected_metadata, key=_dashboard_item_key)
     else:
         logging.info("No metadata collected.")
     
@@ -581,6 +665,18 @@ def main():
         default=9,
         help="Total number of pages to scrape (default: 9)"
     )
+    parser.add_argument(
+        "--page-url-template",
+        default=None,
+        help="URL with a {n} placeholder for the page number (e.g. 'https://example.com/?page={n}'); "
+             "fetches pages directly in parallel instead of clicking pagination"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of browsers used with --page-url-template (default: 4)"
+    )
     
     args = parser.parse_args()
     
@@ -599,6 +695,8 @@ def main():
         wait_time=args.wait_time,
         scroll=not args.no_scroll,
         total_pages=args.total_pages,
+        page_url_template=args.page_url_template,
+        workers=args.workers,
     )
     
     print(f"\n{'='*60}")
@@ -606,7 +704,7 @@ def main():
     print(f"{'='*60}")
     print(f"Collected dashboard metadata from pages")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
@@ -5,22 +5,80 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
+import functools
 import logging
 import os
 import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 from PIL import Image
 
+try:
+    from scripts.image_metadata_store import (
+        METADATA_FILENAME, append_metadata, append_new_metadata, iter_metadata,
+        migrate_legacy_metadata,
+    )
+    from scripts.driver_pool import get_pooled_driver, release_pooled_driver
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        METADATA_FILENAME, append_metadata, append_new_metadata, iter_metadata,
+        migrate_legacy_metadata,
+    )
+    from driver_pool import get_pooled_driver, release_pooled_driver
+
+# Stylesheets and fonts the scraper never needs; Chrome has no content
+# setting for them, so they are blocked at the network layer
+BLOCKED_URL_PATTERNS = [
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf',
+]
+
+AUTHOR_CLASS_RE = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+# Number of ancestor levels searched for an author/byline
+AUTHOR_MAX_DEPTH = 4
+# Closest enclosing tags whose text is used as an image's nearby text
+NEARBY_TEXT_CONTAINERS = ["figure", "article", "li", "section", "div"]
+CLOUDFLARE_IMAGE_PATH = '/cdn-cgi/image/'
+STYLE_URL_RE = re.compile(r'url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)')
+SRCSET_ENTRY_RE = re.compile(r'(.+?)\s+(\d+)w\s*$')
+
+# Common image extensions (plus CDN "thumbnail" endpoints)
+IMAGE_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
+    '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
+)
+
+# SQLite index of saved thumbnail URLs used for dedup across runs
+SEEN_INDEX_FILENAME = "seen.sqlite"
+
+# Number of thumbnails whose dimensions are checked concurrently
+IMAGE_CHECK_WORKERS = 16
+
+# Bytes requested when reading just the image header for its dimensions
+HEADER_RANGE_BYTES = 65536
+
+# Number of thumbnail sizes remembered per process
+IMAGE_SIZE_CACHE_SIZE = 4096
+
+# Pages with at least this many products are parsed across worker processes
+PROCESS_POOL_MIN_PRODUCTS = 64
+
+# Shared session so thumbnail checks reuse keep-alive connections to the CDN
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
     """Setup Chrome WebDriver with options."""
@@ -31,51 +89,98 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    # Only the DOM is needed: thumbnails come from attributes and are checked
+    # separately with requests, so don't wait for or download subresources
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     
     driver = webdriver.Chrome(options=chrome_options)
+    
+    # Block stylesheets and fonts at the network layer
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.debug(f"Failed to configure request blocking: {e}")
+    
     return driver
 
 
+def get_driver(headless: bool = True) -> webdriver.Chrome:
+    """Check out a pooled Chrome WebDriver, starting a new one if none is idle."""
+    return get_pooled_driver(setup_driver, headless)
+
+
+def release_driver(driver: webdriver.Chrome, headless: bool = True) -> None:
+    """Reset a driver's state and return it to the pool for reuse."""
+    release_pooled_driver(driver, setup_driver, headless)
+
+
+def _page_height_changed(last_height: int):
+    """WebDriverWait condition returning the page height once it differs from last_height."""
+    def condition(driver):
+        height = driver.execute_script("return document.body.scrollHeight")
+        return height if height != last_height else False
+    return condition
+
+
 def scroll_page(driver, scroll_pause: float = 2.0, max_scrolls: int = 10):
     """Scroll page to trigger lazy loading."""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
     last_height = driver.execute_script("return document.body.scrollHeight")
     scrolls = 0
     
     while scrolls < max_scrolls:
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause)
-        
-        new_height = driver.execute_script("return document.body.scrollHeight")
+        # Scroll and read the height in a single round-trip
+        new_height = driver.execute_script(
+            "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+        )
         if new_height == last_height:
-            break
+            # Wait up to scroll_pause for lazy content to grow the page, returning
+            # as soon as it does instead of always sleeping the full pause
+            try:
+                new_height = WebDriverWait(driver, scroll_pause, poll_frequency=0.25).until(
+                    _page_height_changed(last_height)
+                )
+            except TimeoutException:
+                break
         last_height = new_height
         scrolls += 1
         logging.info("Scrolled %d times, page height: %d", scrolls, new_height)
 
 
-def _get_nearby_text(element, max_chars: int = 240) -> str:
-    """Extract nearby text content around an element."""
+def _get_nearby_text(element, max_chars: int = 240, max_strings: int = 6) -> str:
+    """Extract text content from the element's closest enclosing container."""
+    # Only walk the local container subtree rather than the rest of the document
+    container = element.find_parent(NEARBY_TEXT_CONTAINERS) or element.parent
+    if container is None:
+        return ""
     texts = []
-    for sibling in element.find_all_next(string=True, limit=6):
-        stripped = sibling.strip()
-        if stripped:
-            texts.append(stripped)
-        if sum(len(t) for t in texts) >= max_chars:
+    total = 0
+    for text in container.stripped_strings:
+        texts.append(text)
+        total += len(text)
+        if total >= max_chars or len(texts) >= max_strings:
             break
-    snippet = " ".join(texts).strip()
-    return snippet[:max_chars] if snippet else ""
+    snippet = " ".join(texts)
+    return snippet[:max_chars]
 
 
 def _find_author(element):
-    """Search ancestor tree for an author/byline-like element."""
-    author_patterns = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
-    for ancestor in element.parents:
-        if ancestor is None:
+    """Search the nearest ancestors for an author/byline-like element."""
+    for depth, ancestor in enumerate(element.parents):
+        if ancestor is None or depth >= AUTHOR_MAX_DEPTH:
             break
         if ancestor.name in ("body", "html"):
             break
-        for candidate in ancestor.find_all(True, class_=author_patterns):
+        for candidate in ancestor.find_all(True, class_=AUTHOR_CLASS_RE):
             text = candidate.get_text(strip=True)
             if text:
                 return text
@@ -89,6 +194,21 @@ def _find_author(element):
     return ""
 
 
+def _is_protocol_at(url: str, pos: int) -> bool:
+    """Return True if an ``http:/`` or ``https:/`` prefix starts at pos."""
+    if url.startswith('https:/', pos):
+        return True
+    return url.startswith('http:/', pos)
+
+
+def _normalize_protocol(url: str) -> str:
+    """Collapse the slashes after a leading http:/https: to exactly two."""
+    for scheme in ('https:', 'http:'):
+        if url.startswith(scheme + '/'):
+            return scheme + '//' + url[len(scheme):].lstrip('/')
+    return url
+
+
 def clean_thumbnail_url(url: str) -> str:
     """
     Clean thumbnail URL by extracting the actual CDN URL from wrapper URLs.
@@ -105,43 +225,44 @@ def clean_thumbnail_url(url: str) -> str:
     # Look for cdn.sanity.io in the URL
     sanity_pos = url.find('cdn.sanity.io')
     if sanity_pos > 0:
-        # Look backwards to find the protocol (https: or http:)
-        # Search in a window before the domain
+        # Look backwards to find the nearest protocol (https:/ or http:/ with any
+        # number of slashes), searching in a window before the domain
         search_start = max(0, sanity_pos - 50)
-        before_domain = url[search_start:sanity_pos]
-        
-        # Find https?: or http?: pattern (with one or two slashes)
-        protocol_match = re.search(r'(https?:/+)', before_domain)
-        if protocol_match:
-            # Get the start position relative to full URL
-            protocol_start = search_start + protocol_match.start()
+        protocol_start = url.rfind('http', search_start, sanity_pos)
+        while protocol_start != -1 and not _is_protocol_at(url, protocol_start):
+            protocol_start = url.rfind('http', search_start, protocol_start)
+        if protocol_start != -1:
             # Find the end (query string or end of URL)
             query_pos = url.find('?', sanity_pos)
             if query_pos == -1:
                 query_pos = len(url)
             
-            # Extract the URL
-            clean_url = url[protocol_start:query_pos]
-            # Fix protocol to always have exactly two slashes (https:/ -> https://, https:/// -> https://)
-            clean_url = re.sub(r'^(https?):/+', r'\1://', clean_url)
-            return clean_url
-    
-    # Try Cloudflare CDN wrapper pattern
-    cloudflare_match = re.search(r'https?://[^/]+/cdn-cgi/image/[^/]+/(https?:/+/[^\s?]+)', url)
-    if cloudflare_match:
-        clean_url = cloudflare_match.group(1)
-        # Fix protocol to always have exactly two slashes
-        clean_url = re.sub(r'^(https?):/+', r'\1://', clean_url)
-        # Remove query parameters
-        if '?' in clean_url:
-            clean_url = clean_url.split('?')[0]
-        return clean_url
+            # Extract the URL and fix protocol to always have exactly two slashes
+            return _normalize_protocol(url[protocol_start:query_pos])
+    
+    # Try Cloudflare CDN wrapper pattern: https://host/cdn-cgi/image/<options>/https://...
+    cf_pos = url.find(CLOUDFLARE_IMAGE_PATH)
+    if cf_pos > 0:
+        scheme_end = url.rfind('://', 0, cf_pos)
+        host = url[scheme_end + 3:cf_pos] if scheme_end != -1 else ""
+        options_start = cf_pos + len(CLOUDFLARE_IMAGE_PATH)
+        options_end = url.find('/', options_start)
+        if (
+            host and '/' not in host
+            and url.endswith(('http', 'https'), 0, scheme_end)
+            and options_end > options_start
+        ):
+            inner = url[options_end + 1:]
+            if inner.startswith(('http://', 'https://')):
+                # Remove query parameters and anything after whitespace
+                inner = inner.split('?', 1)[0]
+                inner = inner.split(None, 1)[0] if inner.strip() else ""
+                inner = _normalize_protocol(inner)
+                if len(inner) > inner.find('//') + 2:
+                    return inner
     
     # If no CDN pattern found, just remove query parameters from the original URL
-    if '?' in url:
-        url = url.split('?')[0]
-    
-    return url
+    return url.split('?', 1)[0]
 
 
 def has_image_extension(url: str) -> bool:
@@ -149,52 +270,101 @@ def has_image_extension(url: str) -> bool:
     if not url:
         return False
     
-    # Common image extensions
-    image_extensions = [
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
-        '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
-    ]
-    
-    # Parse URL and check path
-    parsed = urlparse(url)
-    path = parsed.path.lower()
+    # Ignore any fragment, then split the path from the query string
+    end = url.find('#')
+    if end == -1:
+        end = len(url)
+    query_pos = url.find('?', 0, end)
+    path_end = query_pos if query_pos != -1 else end
     
     # Check if path ends with image extension
-    for ext in image_extensions:
-        if path.endswith(ext):
-            return True
+    if url[:path_end].lower().endswith(IMAGE_EXTENSIONS):
+        return True
     
     # Also check query parameters for image extensions (some CDNs use this)
-    query = parsed.query.lower()
-    for ext in image_extensions:
-        if ext in query:
-            return True
+    if query_pos != -1:
+        query = url[query_pos + 1:end].lower()
+        return any(ext in query for ext in IMAGE_EXTENSIONS)
     
     return False
 
 
-def check_image_dimensions(img_url: str, min_size: int = 200) -> tuple:
+def _read_image_size(data) -> tuple:
+    """
+    Return (width, height) from image bytes, or None if the header is incomplete.
+    
+    Image.open only parses the header; pixel data is never loaded or decoded.
+    Images over PIL's decompression bomb limit raise DecompressionBombError.
+    """
+    try:
+        with Image.open(BytesIO(data)) as img:
+            return img.size
+    except Image.DecompressionBombError:
+        # Reading more bytes would not change the outcome
+        raise
+    except Exception:
+        return None
+
+
+def _fetch_image_size(img_url: str, session: requests.Session) -> tuple:
+    """Fetch just enough of an image to return its (width, height); raises on failure."""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+    
+    # Only the image header is needed for the size, so request the first
+    # bytes and stop reading as soon as PIL can parse it
+    size = None
+    ranged_headers = {**headers, 'Range': f'bytes=0-{HEADER_RANGE_BYTES - 1}'}
+    with session.get(img_url, headers=ranged_headers, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        partial = response.status_code == 206
+        header_data = bytearray()
+        for chunk in response.iter_content(8192):
+            header_data.extend(chunk)
+            size = _read_image_size(header_data)
+            if size:
+                break
+    
+    if size is None:
+        if not partial:
+            raise ValueError("could not parse image header")
+        # Header did not fit in the requested range, fall back to the full image
+        response = session.get(img_url, headers=headers, timeout=10)
+        response.raise_for_status()
+        size = _read_image_size(response.content)
+        if size is None:
+            raise ValueError("could not parse image header")
+    
+    return size
+
+
+@functools.lru_cache(maxsize=IMAGE_SIZE_CACHE_SIZE)
+def _cached_image_size(img_url: str) -> tuple:
+    """Memoized _fetch_image_size over the shared session (failures are not cached)."""
+    return _fetch_image_size(img_url, _SESSION)
+
+
+def check_image_dimensions(img_url: str, min_size: int = 200, session: requests.Session = None) -> tuple:
     """
     Check if an image has width and height greater than min_size.
     
+    Sizes fetched through the shared session are cached per URL, so repeated
+    thumbnails are only downloaded once per process.
+    
     Args:
         img_url: URL of the image to check
         min_size: Minimum width and height in pixels (default: 200)
+        session: requests session to use (default: shared module session)
     
     Returns:
         Tuple of (width, height) if image is valid, (0, 0) otherwise
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        response = requests.get(img_url, headers=headers, timeout=10, stream=True)
-        response.raise_for_status()
-        
-        # Read image into memory
-        img_data = BytesIO(response.content)
-        img = Image.open(img_data)
-        width, height = img.size
+        if session is None:
+            width, height = _cached_image_size(img_url)
+        else:
+            width, height = _fetch_image_size(img_url, session)
         
         if width > min_size and height > min_size:
             return (width, height)
@@ -206,6 +376,14 @@ def check_image_dimensions(img_url: str, min_size: int = 200) -> tuple:
         return (0, 0)
 
 
+def _check_thumbnail_dimensions(meta: dict):
+    """Return (width, height) for the metadata's thumbnail, or None if it has no thumbnail."""
+    thumbnail_url = meta.get("thumbnail", "")
+    if not thumbnail_url:
+        return None
+    return check_image_dimensions(thumbnail_url, min_size=200)
+
+
 def extract_bymarketers_product_metadata(product_tag, base_url: str) -> dict:
     """
     Extract metadata from a ByMarketers product element.
@@ -226,7 +404,7 @@ def extract_bymarketers_product_metadata(product_tag, base_url: str) -> dict:
     
     # Extract title and source_link from product-text-name link
     # There may be multiple links with this class, prioritize the one with text content
-    title_links = product_tag.find_all("a", class_="product-text-name", href=True)
+    title_links = product_tag.select("a.product-text-name[href]")
     for title_link in title_links:
         title_text = title_link.get_text(strip=True)
         if title_text:
@@ -238,7 +416,7 @@ def extract_bymarketers_product_metadata(product_tag, base_url: str) -> dict:
     
     # If title not found, try alternative: button alt link with data-product-title
     if not metadata["title"]:
-        button_link = product_tag.find("a", class_="button alt", href=True)
+        button_link = product_tag.select_one("a.button.alt[href]")
         if button_link:
             href = button_link.get("href", "")
             if href and not metadata["source_link"]:
@@ -255,19 +433,19 @@ def extract_bymarketers_product_metadata(product_tag, base_url: str) -> dict:
             metadata["source_link"] = urljoin(base_url, href.strip())
     
     # Extract extra_text from product-short-description
-    description_div = product_tag.find("div", class_="product-short-description")
+    description_div = product_tag.select_one("div.product-short-description")
     if description_div:
         metadata["extra_text"] = description_div.get_text(strip=True)
     
     # Extract thumbnail from product-img div's style attribute
     # Style format: "background: url(https://...)" or "background: url('https://...')"
-    product_img = product_tag.find("div", class_="product-img")
+    product_img = product_tag.select_one("div.product-img")
     if product_img:
         style_attr = product_img.get("style", "")
         if style_attr:
             # Extract URL from style attribute: background: url(...) or url('...') or url("...")
             # Match: url( followed by optional quote, then URL content, then optional quote and )
-            url_match = re.search(r'url\s*\(\s*["\']?([^"\'()]+)["\']?\s*\)', style_attr)
+            url_match = STYLE_URL_RE.search(style_attr)
             if url_match:
                 img_url = url_match.group(1).strip()
                 if img_url:
@@ -305,7 +483,7 @@ def extract_catchr_card_metadata(card_tag, base_url: str) -> dict:
     }
     
     # Extract thumbnail from cards-image > img
-    cards_image = card_tag.find("div", class_="cards-image")
+    cards_image = card_tag.select_one("div.cards-image")
     if cards_image:
         img_tag = cards_image.find("img")
         if img_tag:
@@ -322,17 +500,17 @@ def extract_catchr_card_metadata(card_tag, base_url: str) -> dict:
                     metadata["thumbnail"] = urljoin(base_url, img_src)
     
     # Extract title from templatename
-    templatename = card_tag.find("div", class_="templatename")
+    templatename = card_tag.select_one("div.templatename")
     if templatename:
         metadata["title"] = templatename.get_text(strip=True)
     
     # Extract extra_text from text-block-52
-    text_block = card_tag.find("div", class_="text-block-52")
+    text_block = card_tag.select_one("div.text-block-52")
     if text_block:
         metadata["extra_text"] = text_block.get_text(strip=True)
     
     # Extract source_link from button-23 link
-    button_link = card_tag.find("a", class_="button-23", href=True)
+    button_link = card_tag.select_one("a.button-23[href]")
     if button_link:
         href = button_link.get("href", "")
         if href:
@@ -341,6 +519,38 @@ def extract_catchr_card_metadata(card_tag, base_url: str) -> dict:
     return metadata
 
 
+def _extract_product_html(product_html: str, base_url: str) -> dict:
+    """Process pool worker: re-parse one product's HTML and extract its metadata."""
+    product_soup = BeautifulSoup(product_html, 'lxml')
+    return extract_bymarketers_product_metadata(product_soup.find('li') or product_soup, base_url)
+
+
+def _extract_products_metadata(products: list, base_url: str) -> list:
+    """Extract metadata for every product tag, fanning out to processes for large pages."""
+    if len(products) < PROCESS_POOL_MIN_PRODUCTS:
+        return [extract_bymarketers_product_metadata(product, base_url) for product in products]
+    
+    product_htmls = [str(product) for product in products]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(
+            _extract_product_html,
+            product_htmls,
+            [base_url] * len(product_htmls),
+            chunksize=16,
+        ))
+
+
+def _iter_srcset_candidates(tag):
+    """Yield (width, url) pairs from the srcset of every <source>/<img> under tag."""
+    # srcset format: "url1 320w, url2 480w, ..."
+    for node in tag.find_all(["source", "img"], srcset=True):
+        for entry in node["srcset"].split(','):
+            # Match: URL (may contain spaces) followed by space and number+w
+            match = SRCSET_ENTRY_RE.search(entry.strip())
+            if match:
+                yield int(match.group(2)), match.group(1).strip()
+
+
 def extract_supermetrics_report_metadata(article_tag, base_url: str) -> dict:
     """
     Extract metadata from a Supermetrics report article.
@@ -359,7 +569,7 @@ def extract_supermetrics_report_metadata(article_tag, base_url: str) -> dict:
     }
     
     # Extract title and source_link from <a><h3> structure
-    link_tag = article_tag.find("a", href=True)
+    link_tag = article_tag.select_one("a[href]")
     if link_tag:
         href = link_tag.get("href", "")
         if href:
@@ -372,59 +582,17 @@ def extract_supermetrics_report_metadata(article_tag, base_url: str) -> dict:
     # Extract thumbnail from <picture> tag
     picture_tag = article_tag.find("picture")
     if picture_tag:
-        # First try to get the highest resolution from srcset in <source> tags
-        best_url = None
-        best_width = 0
-        
-        # Check all <source> tags for srcset
-        for source in picture_tag.find_all("source", srcset=True):
-            srcset = source.get("srcset", "")
-            # Parse srcset: "url1 320w, url2 480w, ..."
-            # Split by comma first, then parse each entry
-            for entry in srcset.split(','):
-                entry = entry.strip()
-                # Match: URL (may contain spaces) followed by space and number+w
-                match = re.search(r'(.+?)\s+(\d+)w\s*$', entry)
-                if match:
-                    url = match.group(1).strip()
-                    width_str = match.group(2)
-                    try:
-                        width = int(width_str)
-                        if width > best_width:
-                            best_width = width
-                            best_url = url
-                    except ValueError:
-                        continue
+        # Pick the highest resolution entry across all <source>/<img> srcsets
+        best = max(_iter_srcset_candidates(picture_tag), key=lambda pair: pair[0], default=None)
+        best_url = best[1] if best and best[0] > 0 else None
         
-        # If no srcset found, try the <img> tag
+        # Fall back to the <img> src attribute
         if not best_url:
             img_tag = picture_tag.find("img")
             if img_tag:
-                # Try srcset first
-                img_srcset = img_tag.get("srcset", "")
-                if img_srcset:
-                    # Parse srcset: "url1 320w, url2 480w, ..."
-                    # Split by comma first, then parse each entry
-                    for entry in img_srcset.split(','):
-                        entry = entry.strip()
-                        # Match: URL (may contain spaces) followed by space and number+w
-                        match = re.search(r'(.+?)\s+(\d+)w\s*$', entry)
-                        if match:
-                            url = match.group(1).strip()
-                            width_str = match.group(2)
-                            try:
-                                width = int(width_str)
-                                if width > best_width:
-                                    best_width = width
-                                    best_url = url
-                            except ValueError:
-                                continue
-                
-                # Fall back to src attribute
-                if not best_url:
-                    img_src = img_tag.get("src", "")
-                    if img_src:
-                        best_url = img_src.strip()
+                img_src = img_tag.get("src", "")
+                if img_src:
+                    best_url = img_src.strip()
         
         if best_url:
             # Clean up the URL - extract actual CDN URL from wrapper URLs
@@ -485,6 +653,69 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
     return metadata
 
 
+def _mark_seen_index_current(seen_index: sqlite3.Connection, metadata_path: Path) -> None:
+    """Record the metadata file's mtime as the version the index reflects."""
+    mtime_ns = metadata_path.stat().st_mtime_ns if metadata_path.exists() else 0
+    seen_index.execute(
+        "INSERT OR REPLACE INTO index_state VALUES ('metadata_mtime_ns', ?)", (mtime_ns,)
+    )
+
+
+def open_seen_index(output_dir: Path) -> sqlite3.Connection:
+    """
+    Open the persistent index of already-saved thumbnail URLs.
+    
+    The index lives next to image_metadata.jsonl and remembers the mtime of the
+    metadata file it was built from. It is rebuilt whenever the file has changed
+    since, e.g. because another scraper appended to it, so later runs can dedup
+    without reading the metadata file.
+    """
+    seen_index = sqlite3.connect(output_dir / SEEN_INDEX_FILENAME)
+    seen_index.execute("PRAGMA journal_mode=WAL")
+    seen_index.execute("PRAGMA synchronous=NORMAL")
+    seen_index.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY)")
+    seen_index.execute("CREATE TABLE IF NOT EXISTS index_state (key TEXT PRIMARY KEY, value INTEGER)")
+    
+    metadata_path = output_dir / METADATA_FILENAME
+    if not metadata_path.exists():
+        return seen_index
+    
+    row = seen_index.execute(
+        "SELECT value FROM index_state WHERE key = 'metadata_mtime_ns'"
+    ).fetchone()
+    if row is not None and row[0] == metadata_path.stat().st_mtime_ns:
+        return seen_index
+    
+    # Rebuild rather than top up so entries removed from the file drop out too
+    urls = (
+        item.get("thumbnail")
+        for item in iter_metadata(metadata_path)
+        if isinstance(item, dict)
+    )
+    seen_index.execute("DELETE FROM seen")
+    seen_index.executemany(
+        "INSERT OR IGNORE INTO seen VALUES (?)", ((url,) for url in urls if url)
+    )
+    _mark_seen_index_current(seen_index, metadata_path)
+    seen_index.commit()
+    logging.info("Built seen-thumbnail index from %s", metadata_path)
+    return seen_index
+
+
+def _save_page_source(page_source: str) -> None:
+    """Write the rendered page source to debug_output/ for inspection."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    debug_dir = Path("debug_output")
+    page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
+    
+    try:
+        debug_dir.mkdir(exist_ok=True)
+        page_source_file.write_bytes(page_source.encode('utf-8'))
+        logging.info(f"Saved page source to: {page_source_file}")
+    except Exception as e:
+        logging.warning(f"Failed to save page source: {e}")
+
+
 def scrape_images_with_js(
     url: str,
     output_dir: Path,
@@ -504,7 +735,7 @@ def scrape_images_with_js(
     
     Args:
         url: ByMarketers URL to scrape
-        output_dir: Directory to save metadata
+        output_dir: Directory to save metadata (appended to image_metadata.jsonl)
         keywords: (Unused - kept for backwards compatibility)
         headless: Run browser in headless mode
         wait_time: Seconds to wait for JavaScript to load
@@ -515,7 +746,7 @@ def scrape_images_with_js(
     """
     logging.info("Starting browser and loading: %s", url)
     
-    driver = setup_driver(headless)
+    driver = get_driver(headless)
     
     try:
         driver.get(url)
@@ -529,111 +760,104 @@ def scrape_images_with_js(
         
         page_source = driver.page_source
         
-        # Save page source for debugging
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_dir = Path("debug_output")
-        debug_dir.mkdir(exist_ok=True)
-        page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
-        
-        try:
-            with open(page_source_file, 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            logging.info(f"Saved page source to: {page_source_file}")
-        except Exception as e:
-            logging.warning(f"Failed to save page source: {e}")
+        # Save page source for debugging in the background while parsing continues
+        threading.Thread(target=_save_page_source, args=(page_source,)).start()
         
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = BeautifulSoup(page_source, 'lxml')
         
         # ByMarketers-specific: Find all product li elements
         collected_metadata = []
-        products = soup.find_all('li', class_=lambda x: x and 'product' in x.split() if x else False)
+        products = soup.select('li.product')
         logging.info("Found %d product elements", len(products))
         
-        for idx, product in enumerate(products, 1):
+        candidates = []
+        for idx, meta in enumerate(_extract_products_metadata(products, url), 1):
             logging.info("Processing product %d/%d", idx, len(products))
-            meta = extract_bymarketers_product_metadata(product, url)
             
             # Only process if we have at least a thumbnail or title
             if not (meta.get("thumbnail") or meta.get("title")):
                 logging.warning("Skipping product %d - no thumbnail or title found", idx)
                 continue
+            candidates.append((idx, meta))
+        
+        # Check image dimensions concurrently - skip if width or height <= 200px
+        logging.info("Checking thumbnail dimensions for %d products", len(candidates))
+        with ThreadPoolExecutor(max_workers=IMAGE_CHECK_WORKERS) as executor:
+            dimensions = executor.map(_check_thumbnail_dimensions, (meta for _, meta in candidates))
             
-            # Check image dimensions - skip if width or height <= 200px
-            thumbnail_url = meta.get("thumbnail", "")
-            if thumbnail_url:
-                logging.info("Checking dimensions for thumbnail: %s", thumbnail_url)
-                width, height = check_image_dimensions(thumbnail_url, min_size=200)
-                if width == 0 or height == 0:
-                    logging.warning(
-                        "Skipping product %d - image dimensions too small (thumbnail: %s)",
-                        idx, thumbnail_url
+            for (idx, meta), dims in zip(candidates, dimensions):
+                thumbnail_url = meta.get("thumbnail", "")
+                if dims is not None:
+                    width, height = dims
+                    if width == 0 or height == 0:
+                        logging.warning(
+                            "Skipping product %d - image dimensions too small (thumbnail: %s)",
+                            idx, thumbnail_url
+                        )
+                        continue
+                    logging.info(
+                        "Image dimensions OK: %dx%d (thumbnail: %s)",
+                        width, height, thumbnail_url
                     )
-                    continue
-                logging.info(
-                    "Image dimensions OK: %dx%d (thumbnail: %s)",
-                    width, height, thumbnail_url
+                
+                # Add to collected metadata if it passed all checks
+                collected_metadata.append(meta)
+                logging.debug(
+                    "Extracted: title='%s', source_link='%s', thumbnail='%s', extra_text='%s'",
+                    meta.get("title", ""),
+                    meta.get("source_link", ""),
+                    meta.get("thumbnail", ""),
+                    meta.get("extra_text", "")
                 )
-            
-            # Add to collected metadata if it passed all checks
-            collected_metadata.append(meta)
-            logging.debug(
-                "Extracted: title='%s', source_link='%s', thumbnail='%s', extra_text='%s'",
-                meta.get("title", ""),
-                meta.get("source_link", ""),
-                meta.get("thumbnail", ""),
-                meta.get("extra_text", "")
-            )
         
         logging.info("Collected metadata for %d products", len(collected_metadata))
         
     finally:
-        driver.quit()
+        release_driver(driver, headless)
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
     new_metadata_entries = []
     
     if collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
+        metadata_path = migrate_legacy_metadata(output_dir)
+        try:
+            seen_index = open_seen_index(output_dir)
+        except Exception as exc:
+            # Dedup against the metadata file itself instead of losing the run
+            logging.warning("Failed to open seen-thumbnail index, reading %s instead: %s", metadata_path, exc)
+            return append_new_metadata(output_dir, collected_metadata)
         
-        if metadata_path.exists():
+        try:
+            run_urls = set()
+            for meta in collected_metadata:
+                url = meta.get("thumbnail")
+                if url:
+                    if url in run_urls or seen_index.execute(
+                        "SELECT 1 FROM seen WHERE url = ? LIMIT 1", (url,)
+                    ).fetchone():
+                        continue
+                    run_urls.add(url)
+                new_metadata_entries.append(meta)
+            
+            # Append only the new entries instead of rewriting the whole file
             try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
+                append_metadata(output_dir, new_metadata_entries)
+                seen_index.executemany(
+                    "INSERT OR IGNORE INTO seen VALUES (?)", ((url,) for url in run_urls)
+                )
+                # The index now covers this append as well
+                _mark_seen_index_current(seen_index, metadata_path)
+                seen_index.commit()
+                logging.info(
+                    "Saved metadata for %d new images to %s",
+                    len(new_metadata_entries),
+                    metadata_path,
+                )
             except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
-        
-        combined_metadata = list(existing_metadata)
-        for meta in collected_metadata:
-            url = meta.get("thumbnail")
-            if url and url in existing_urls:
-                continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
-            new_metadata_entries.append(meta)
-        
-        try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
-            logging.info(
-                "Saved metadata for %d new images (total %d) to %s",
-                len(new_metadata_entries),
-                len(combined_metadata),
-                metadata_path,
-            )
-        except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
+                logging.warning("Failed to save metadata JSONL: %s", exc)
+        finally:
+            seen_index.close()
     else:
         logging.info("No additional metadata collected for images.")
     
@@ -703,7 +927,7 @@ def main():
     print(f"{'='*60}")
     print(f"Collected image metadata from page")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
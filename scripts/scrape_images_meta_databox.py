@@ -5,18 +5,125 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
+import functools
+import hashlib
 import logging
+import math
 import os
 import re
-import time
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from PIL import Image
+
+try:
+    from scripts.image_metadata_store import (
+        METADATA_FILENAME, append_metadata, export_json, iter_metadata, migrate_legacy_metadata,
+    )
+    from scripts.driver_pool import get_pooled_driver, release_pooled_driver
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        METADATA_FILENAME, append_metadata, export_json, iter_metadata, migrate_legacy_metadata,
+    )
+    from driver_pool import get_pooled_driver, release_pooled_driver
+
+# Requests the scraper never needs: fonts and analytics/tracking scripts.
+# Stylesheets stay enabled so lazy-loaded cards still lay out and trigger.
+BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*hotjar.com*', '*facebook.net*',
+]
+
+# Class names that mark an author/byline element
+AUTHOR_CLASS_RE = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+# srcset candidates from <img> tags, matched by file extension
+SRCSET_IMAGE_RE = re.compile(r'([^\s,]+(?:\.jpg|\.jpeg|\.png|\.gif|\.webp)[^\s,]*)', re.IGNORECASE)
+# srcset candidates from <source> tags, matched as absolute URLs
+SRCSET_URL_RE = re.compile(r'(https?://[^\s,]+)')
+
+# Common image extensions
+IMAGE_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
+    '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
+)
+# Any of IMAGE_EXTENSIONS appearing in a query string (some CDNs use this)
+QUERY_IMAGE_EXT_RE = re.compile(r'\.(?:jpe?g|png|gif|webp|bmp|tiff?|heic|heif|avif|jfif)|thumbnail')
+
+# Databox template card container; class*= keeps the substring match on class names
+TEMPLATE_CARD_SELECTOR = "div[class*='dbx-template-card']"
+
+# True once the document has loaded and rendered a template card or image
+PAGE_READY_JS = (
+    "return document.readyState === 'complete' && "
+    "document.querySelector(\"div[class*='dbx-template-card'], img\") !== null;"
+)
+
+# Bloom filter of stored thumbnail URLs, kept next to the metadata file
+BLOOM_FILENAME = "image_metadata.bloom"
+BLOOM_ERROR_RATE = 0.001
+BLOOM_MIN_CAPACITY = 100_000
+
+# Sizes the browser already knows for every <img>: natural size if it
+# loaded, otherwise its width/height attributes (images are blocked, so
+# usually the latter)
+IMAGE_SIZES_JS = """
+return Array.from(document.images, function(img) {
+    var width = img.naturalWidth || parseInt(img.getAttribute('width'), 10) || 0;
+    var height = img.naturalHeight || parseInt(img.getAttribute('height'), 10) || 0;
+    return [img.currentSrc || img.src, width, height];
+}).filter(function(entry) { return entry[0] && entry[1] && entry[2]; });
+"""
+
+# Title, link, text and size of the template card around every <img>, found
+# with the same closest(TEMPLATE_CARD_SELECTOR) match as the soup path.
+# URLs are resolved against the document; sizes fall back to the
+# width/height attributes
+TEMPLATE_CARDS_JS = """
+function text(el) { return el ? el.textContent.replace(/\\s+/g, ' ').trim() : ''; }
+function absolute(value) { return value ? new URL(value.trim(), document.baseURI).href : ''; }
+var cardSelector = arguments[0];
+return Array.from(document.images, function(img) {
+    var card = img.closest(cardSelector);
+    var src = img.getAttribute('src') || img.getAttribute('data-src') || img.getAttribute('data-lazy-src');
+    if (!card || !src || src.trim().startsWith('data:')) { return null; }
+    var anchor = card.querySelector("a[class*='dbx-container-anchor'][href]");
+    return {
+        thumbnail: absolute(src),
+        width: img.naturalWidth || parseInt(img.getAttribute('width'), 10) || 0,
+        height: img.naturalHeight || parseInt(img.getAttribute('height'), 10) || 0,
+        title: text(card.querySelector("h4[class*='dbx-template-card__title']")),
+        source_link: anchor ? absolute(anchor.getAttribute('href')) : '',
+        extra_text: text(card.querySelector("p[class*='dbx-template-card__text']"))
+    };
+}).filter(Boolean);
+"""
+
+# Distinct (base URL, relative URL) pairs memoized by _absolute_url
+URLJOIN_CACHE_SIZE = 8192
+
+# Per-image log lines are DEBUG; INFO reports progress every this many images
+LOG_PROGRESS_EVERY = 50
+
+# Bytes requested per image; the dimensions live in the file header
+PROBE_RANGE_BYTES = 16384
+# Number of images probed concurrently
+PROBE_WORKERS = 16
+
+# Shared session so probes reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=20, pool_maxsize=50))
 
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
@@ -28,23 +135,62 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    # Only the image URLs are needed (dimensions are probed over HTTP),
+    # so skip downloading images and suppress notification prompts
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
     
     driver = webdriver.Chrome(options=chrome_options)
+    
+    # Block fonts and analytics at the network layer
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.debug(f"Failed to configure request blocking: {e}")
+    
     return driver
 
 
+def get_driver(headless: bool = True) -> webdriver.Chrome:
+    """Check out a pooled Chrome WebDriver, starting a new one if none is idle."""
+    return get_pooled_driver(setup_driver, headless)
+
+
+def release_driver(driver: webdriver.Chrome, headless: bool = True) -> None:
+    """Reset a driver's state and return it to the pool for reuse."""
+    release_pooled_driver(driver, setup_driver, headless)
+
+
+def _page_height_changed(last_height: int):
+    """WebDriverWait condition returning the page height once it differs from last_height."""
+    def condition(driver):
+        height = driver.execute_script("return document.body.scrollHeight")
+        return height if height != last_height else False
+    return condition
+
+
 def scroll_page(driver, scroll_pause: float = 2.0, max_scrolls: int = 10):
     """Scroll page to trigger lazy loading."""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
     last_height = driver.execute_script("return document.body.scrollHeight")
     scrolls = 0
     
     while scrolls < max_scrolls:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause)
-        
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        # Return as soon as lazy content grows the page instead of always
+        # sleeping the full pause; stop scrolling once it no longer grows
+        try:
+            new_height = WebDriverWait(driver, scroll_pause, poll_frequency=0.25).until(
+                _page_height_changed(last_height)
+            )
+        except TimeoutException:
             break
         last_height = new_height
         scrolls += 1
@@ -64,25 +210,43 @@ def _get_nearby_text(element, max_chars: int = 240) -> str:
     return snippet[:max_chars] if snippet else ""
 
 
-def _find_author(element):
-    """Search ancestor tree for an author/byline-like element."""
-    author_patterns = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+def _author_in_ancestor(ancestor) -> str:
+    """Return author text found within a single ancestor, or an empty string."""
+    for candidate in ancestor.find_all(True, class_=AUTHOR_CLASS_RE):
+        text = candidate.get_text(strip=True)
+        if text:
+            return text
+    # Look for explicit data-author or itemprop
+    if ancestor.has_attr("data-author"):
+        return ancestor["data-author"].strip()
+    if ancestor.has_attr("itemprop") and "author" in ancestor["itemprop"]:
+        text = ancestor.get_text(strip=True)
+        if text:
+            return text
+    return ""
+
+
+def _find_author(element, cache: dict = None):
+    """
+    Search ancestor tree for an author/byline-like element.
+    
+    ``cache`` maps ``id(ancestor)`` to the author found in that ancestor so that
+    template cards sharing a grid do not rescan the same subtrees. It must only
+    be reused while the soup it was built from is alive.
+    """
     for ancestor in element.parents:
         if ancestor is None:
             break
         if ancestor.name in ("body", "html"):
             break
-        for candidate in ancestor.find_all(True, class_=author_patterns):
-            text = candidate.get_text(strip=True)
-            if text:
-                return text
-        # Look for explicit data-author or itemprop
-        if ancestor.has_attr("data-author"):
-            return ancestor["data-author"].strip()
-        if ancestor.has_attr("itemprop") and "author" in ancestor["itemprop"]:
-            text = ancestor.get_text(strip=True)
-            if text:
-                return text
+        key = id(ancestor)
+        author = cache.get(key) if cache is not None else None
+        if author is None:
+            author = _author_in_ancestor(ancestor)
+            if cache is not None:
+                cache[key] = author
+        if author:
+            return author
     return ""
 
 
@@ -91,112 +255,118 @@ def has_image_extension(url: str) -> bool:
     if not url:
         return False
     
-    # Common image extensions
-    image_extensions = [
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
-        '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
-    ]
-    
     # Parse URL and check path
     parsed = urlparse(url)
     path = parsed.path.lower()
     
-    # Check if path ends with image extension
-    for ext in image_extensions:
-        if path.endswith(ext):
-            return True
-    
-    # Also check query parameters for image extensions (some CDNs use this)
-    query = parsed.query.lower()
-    for ext in image_extensions:
-        if ext in query:
-            return True
-    
-    return False
+    # Check if path ends with image extension, then the query parameters
+    if path.endswith(IMAGE_EXTENSIONS):
+        return True
+    return QUERY_IMAGE_EXT_RE.search(parsed.query.lower()) is not None
+
+
+def _read_image_size(data) -> tuple:
+    """Return (width, height) from image bytes, or None if the header is incomplete."""
+    try:
+        with Image.open(BytesIO(data)) as img:
+            return img.size
+    except Exception:
+        return None
 
 
-def check_image_dimensions(driver: webdriver.Chrome, img_url: str, min_size: int = 200) -> tuple:
+def probe_dimensions(session: requests.Session, img_url: str) -> tuple:
     """
-    Check if an image has width and height greater than min_size.
+    Read an image's dimensions from the first bytes of the file.
     
     Args:
-        driver: Selenium WebDriver instance
+        session: requests session used for the ranged GET
         img_url: URL of the image to check
-        min_size: Minimum width and height in pixels (default: 200)
     
     Returns:
-        Tuple of (width, height) if image is valid, (0, 0) otherwise
+        Tuple of (width, height), or (0, 0) if the header could not be read
     """
     try:
-        # Use JavaScript to load and check image dimensions
-        # execute_async_script requires callback as last argument
-        script = """
-        const img = new Image();
-        img.crossOrigin = 'anonymous';
-        const url = arguments[0];
-        const callback = arguments[arguments.length - 1];
-        
-        img.onload = function() {
-            callback({width: this.naturalWidth, height: this.naturalHeight});
-        };
-        img.onerror = function() {
-            callback({width: 0, height: 0});
-        };
-        
-        img.src = url;
-        
-        // Timeout after 5 seconds
-        setTimeout(function() {
-            callback({width: 0, height: 0});
-        }, 5000);
-        """
-        dimensions = driver.execute_async_script(script, img_url)
-        width = dimensions.get('width', 0)
-        height = dimensions.get('height', 0)
-        
-        return (width, height)
+        headers = {'Range': f'bytes=0-{PROBE_RANGE_BYTES - 1}'}
+        with session.get(img_url, headers=headers, timeout=5, stream=True) as response:
+            response.raise_for_status()
+            header_data = bytearray()
+            for chunk in response.iter_content(4096):
+                header_data.extend(chunk)
+                size = _read_image_size(header_data)
+                if size:
+                    return size
+                if len(header_data) >= PROBE_RANGE_BYTES:
+                    break
     except Exception as e:
-        logging.debug(f"Failed to check dimensions for {img_url}: {e}")
-        return (0, 0)
+        logging.debug("Failed to check dimensions for %s: %s", img_url, e)
+    return (0, 0)
+
+
+def probe_dimensions_batch(img_urls: list, workers: int = PROBE_WORKERS) -> dict:
+    """Probe dimensions for every URL concurrently; returns {url: (width, height)}."""
+    if not img_urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(img_urls)))) as executor:
+        sizes = executor.map(lambda img_url: probe_dimensions(_SESSION, img_url), img_urls)
+        return dict(zip(img_urls, sizes))
+
+
+@functools.lru_cache(maxsize=URLJOIN_CACHE_SIZE)
+def _absolute_url(base_url: str, url: str) -> str:
+    """urljoin, returning already-absolute http(s) URLs unchanged."""
+    if url.startswith(('http://', 'https://')):
+        return url
+    return urljoin(base_url, url)
 
 
-def extract_image_metadata(img_tag, base_url: str) -> dict:
-    """Derive contextual metadata for an image tag."""
+def extract_image_metadata(img_tag, base_url: str, author_cache: dict = None, card: dict = None) -> dict:
+    """
+    Derive contextual metadata for an image tag.
+    
+    Pass the same ``author_cache`` dict for every image of one parsed page to
+    share author lookups between images with common ancestors. ``card`` is the
+    image's entry from harvest_template_cards, if any; its title, link and text
+    are used instead of searching the soup for them.
+    """
     metadata = {}
     
     src = img_tag.get("src") or img_tag.get("data-src") or img_tag.get("data-lazy-src")
     if src:
-        metadata["thumbnail"] = urljoin(base_url, src.strip())
+        metadata["thumbnail"] = _absolute_url(base_url, src.strip())
     else:
         metadata["thumbnail"] = ""
     
     # For Databox template cards, look for parent dbx-template-card container
-    template_card = img_tag.find_parent("div", class_=lambda x: x and "dbx-template-card" in x)
+    template_card = None if card else img_tag.css.closest(TEMPLATE_CARD_SELECTOR)
     
-    if template_card:
+    if card:
+        metadata["title"] = card["title"]
+        metadata["source_link"] = card["source_link"]
+        metadata["extra_text"] = card["extra_text"]
+    elif template_card:
         # Extract title from h4.dbx-template-card__title
-        title_elem = template_card.find("h4", class_=lambda x: x and "dbx-template-card__title" in x)
+        title_elem = template_card.select_one("h4[class*='dbx-template-card__title']")
         if title_elem:
             metadata["title"] = title_elem.get_text(strip=True)
         else:
             metadata["title"] = ""
         
         # Extract source link from a.dbx-container-anchor
-        anchor = template_card.find("a", class_=lambda x: x and "dbx-container-anchor" in x)
+        anchor = template_card.select_one("a[class*='dbx-container-anchor']")
         if anchor and anchor.get("href"):
-            metadata["source_link"] = urljoin(base_url, anchor["href"])
+            metadata["source_link"] = _absolute_url(base_url, anchor["href"])
         else:
             metadata["source_link"] = ""
         
         # Extract extra_text from p.dbx-template-card__text
-        text_elem = template_card.find("p", class_=lambda x: x and "dbx-template-card__text" in x)
+        text_elem = template_card.select_one("p[class*='dbx-template-card__text']")
         if text_elem:
             metadata["extra_text"] = text_elem.get_text(" ", strip=True)
     else:
         # Fallback to original logic for non-Databox structures
         anchor = img_tag.find_parent("a", href=True)
         if anchor:
-            metadata["source_link"] = urljoin(base_url, anchor["href"])
+            metadata["source_link"] = _absolute_url(base_url, anchor["href"])
         else:
             metadata["source_link"] = ""
         
@@ -210,7 +380,7 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
                     title = caption.get_text(strip=True)
         metadata["title"] = title or ""
     
-    metadata["author"] = _find_author(img_tag)
+    metadata["author"] = _find_author(img_tag, author_cache)
     
     # Only set extra_text if it wasn't already set from Databox template
     if "extra_text" not in metadata or not metadata.get("extra_text"):
@@ -227,6 +397,229 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
     return metadata
 
 
+def _resolve_candidate(raw_url: str, base_url: str):
+    """Return the absolute image URL for a raw src/srcset value, or None if it is not one."""
+    raw_url = raw_url.strip()
+    if not raw_url or raw_url.startswith('data:'):
+        return None
+    full_url = _absolute_url(base_url, raw_url.split()[0])
+    
+    # Filter: only include URLs with image extensions
+    if not has_image_extension(full_url):
+        logging.debug("Skipping URL without image extension: %s", full_url)
+        return None
+    return full_url
+
+
+def iter_candidate_urls(soup, base_url: str):
+    """
+    Yield (image_url, img_tag) for every image candidate on the page in one tree walk.
+    
+    URLs are absolute and already filtered by extension; img_tag is the <img>
+    whose src produced the URL, or None for srcset/<source>/<meta> candidates.
+    <img> candidates come first, then <source>, then <meta>/<link> tags
+    (og:image, twitter:image, image_src).
+    
+    Each URL is yielded once, plus once more with its tag if an <img> src
+    repeats a URL first seen in a srcset; repeated raw values are skipped
+    before they are resolved.
+    """
+    source_urls = []
+    meta_urls = []
+    seen = set()       # resolved URLs already yielded
+    described = set()  # resolved URLs already yielded with their <img>
+    seen_raw = set()   # raw srcset/<source>/<meta> values already handled
+    
+    def resolve_once(raw_url):
+        if raw_url in seen_raw:
+            return None
+        seen_raw.add(raw_url)
+        full_url = _resolve_candidate(raw_url, base_url)
+        if full_url is None or full_url in seen:
+            return None
+        seen.add(full_url)
+        return full_url
+    
+    for tag in soup.find_all(['img', 'source', 'meta', 'link']):
+        if tag.name == 'img':
+            src = tag.get('src') or tag.get('data-src') or tag.get('data-lazy-src')
+            srcset = tag.get('srcset') or tag.get('data-srcset')
+            
+            if src:
+                full_url = _resolve_candidate(src, base_url)
+                if full_url and full_url not in described:
+                    described.add(full_url)
+                    seen.add(full_url)
+                    yield full_url, tag
+            
+            if srcset:
+                for match in SRCSET_IMAGE_RE.finditer(srcset):
+                    full_url = resolve_once(match.group(1))
+                    if full_url:
+                        yield full_url, None
+        
+        elif tag.name == 'source':
+            srcset = tag.get('srcset') or tag.get('data-srcset')
+            src = tag.get('src')
+            
+            if srcset:
+                source_urls.extend(SRCSET_URL_RE.findall(srcset))
+            
+            if src:
+                source_urls.append(src)
+        
+        elif tag.get('property') in ['og:image', 'twitter:image']:
+            content = tag.get('content')
+            if content:
+                meta_urls.append(content)
+        elif tag.get('rel') == ['image_src']:
+            href = tag.get('href')
+            if href:
+                meta_urls.append(href)
+    
+    for raw_url in source_urls + meta_urls:
+        full_url = resolve_once(raw_url)
+        if full_url:
+            yield full_url, None
+
+
+class UrlBloomFilter:
+    """
+    Fixed-size Bloom filter of URLs.
+    
+    Uses ~1.8 bytes per URL at the default error rate instead of a full string
+    in a set. A false positive makes a new image look already stored, so it is
+    skipped; there are no false negatives. ``source_stamp`` is the
+    (st_size, st_mtime_ns) of the metadata file the filter reflects.
+    """
+    
+    _HEADER = struct.Struct("<QQQQQQ")
+    
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self.source_stamp = (0, 0)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, url: str):
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def __contains__(self, url: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(url))
+    
+    def add(self, url: str) -> bool:
+        """Add url; returns True if it was (probably) already present."""
+        present = True
+        for pos in self._positions(url):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                present = False
+        if not present:
+            self.count += 1
+        return present
+    
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+    
+    def save(self, path: Path) -> None:
+        header = self._HEADER.pack(
+            self.capacity, self.num_bits, self.num_hashes, self.count, *self.source_stamp
+        )
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(header + self.bits)
+        tmp_path.replace(path)
+    
+    @classmethod
+    def load(cls, path: Path) -> "UrlBloomFilter":
+        data = path.read_bytes()
+        bloom = cls.__new__(cls)
+        (bloom.capacity, bloom.num_bits, bloom.num_hashes, bloom.count,
+         *source_stamp) = cls._HEADER.unpack_from(data)
+        bloom.source_stamp = tuple(source_stamp)
+        bloom.bits = bytearray(data[cls._HEADER.size:])
+        if len(bloom.bits) != (bloom.num_bits + 7) // 8:
+            raise ValueError(f"Corrupt bloom filter file: {path}")
+        return bloom
+
+
+def _metadata_stamp(metadata_path: Path) -> tuple:
+    """Return (st_size, st_mtime_ns) of the metadata file, or (0, 0) if it is missing."""
+    if not metadata_path.exists():
+        return (0, 0)
+    stat = metadata_path.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def load_seen_filter(output_dir: Path, metadata_path: Path) -> UrlBloomFilter:
+    """
+    Return the Bloom filter of stored thumbnail URLs for output_dir.
+    
+    The persisted filter is used when it was saved for the metadata file's
+    current size and mtime and is not over capacity; otherwise it is rebuilt
+    from the metadata.
+    """
+    bloom_path = output_dir / BLOOM_FILENAME
+    if bloom_path.exists():
+        try:
+            bloom = UrlBloomFilter.load(bloom_path)
+            if bloom.source_stamp == _metadata_stamp(metadata_path) and not bloom.is_full():
+                return bloom
+        except Exception as exc:
+            logging.warning("Failed to load bloom filter, rebuilding: %s", exc)
+    
+    urls = []
+    if metadata_path.exists():
+        try:
+            for item in iter_metadata(metadata_path):
+                if isinstance(item, dict) and item.get("thumbnail"):
+                    urls.append(item["thumbnail"])
+        except Exception as exc:
+            logging.warning("Failed to read existing metadata JSONL: %s", exc)
+    
+    bloom = UrlBloomFilter(max(BLOOM_MIN_CAPACITY, 2 * len(urls)))
+    for url in urls:
+        bloom.add(url)
+    logging.info("Built bloom filter from %d stored metadata entries", len(urls))
+    return bloom
+
+
+def harvest_template_cards(driver) -> dict:
+    """
+    Read the template card of every card image in the browser with one script.
+    
+    Returns a dict mapping each image's absolute thumbnail URL to its card's
+    title, source_link, extra_text, width and height; empty if the page has
+    no template cards.
+    """
+    try:
+        cards = driver.execute_script(TEMPLATE_CARDS_JS, TEMPLATE_CARD_SELECTOR) or []
+    except Exception as e:
+        logging.debug(f"Failed to harvest template cards in the browser: {e}")
+        return {}
+    return {card["thumbnail"]: card for card in cards}
+
+
+def _save_page_source(page_source: str) -> None:
+    """Write the rendered HTML to a timestamped file in debug_output/."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    debug_dir = Path("debug_output")
+    debug_dir.mkdir(exist_ok=True)
+    page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
+    
+    try:
+        page_source_file.write_bytes(page_source.encode('utf-8', 'replace'))
+        logging.info(f"Saved page source to: {page_source_file}")
+    except Exception as e:
+        logging.warning(f"Failed to save page source: {e}")
+
+
 def scrape_images_with_js(
     url: str,
     output_dir: Path,
@@ -234,6 +627,8 @@ def scrape_images_with_js(
     headless: bool = True,
     wait_time: int = 5,
     scroll: bool = True,
+    probe_workers: int = PROBE_WORKERS,
+    save_page_source: bool = False,
 ) -> list:
     """
     Scrape ALL images from JavaScript-rendered page.
@@ -245,130 +640,122 @@ def scrape_images_with_js(
         headless: Run browser in headless mode
         wait_time: Seconds to wait for JavaScript to load
         scroll: Whether to scroll page for lazy-loaded images
+        probe_workers: Number of concurrent image dimension probes
+        save_page_source: Save the rendered HTML to debug_output/
     
     Returns:
         List of saved file paths
     """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
     logging.info("Starting browser and loading: %s", url)
     
-    driver = setup_driver(headless)
+    driver = get_driver(headless)
     
     try:
         driver.get(url)
         
-        logging.info("Waiting %d seconds for JavaScript to load...", wait_time)
-        time.sleep(wait_time)
+        logging.info("Waiting up to %d seconds for JavaScript to load...", wait_time)
+        try:
+            WebDriverWait(driver, wait_time).until(
+                lambda d: d.execute_script(PAGE_READY_JS)
+            )
+        except TimeoutException:
+            logging.warning("Page not ready after %d seconds, continuing anyway", wait_time)
         
         if scroll:
             logging.info("Scrolling page to load lazy images...")
             scroll_page(driver)
         
-        page_source = driver.page_source
+        # Save page source for debugging (only on request or at DEBUG level)
+        if save_page_source or logging.getLogger().isEnabledFor(logging.DEBUG):
+            _save_page_source(driver.page_source)
         
-        # Save page source for debugging
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_dir = Path("debug_output")
-        debug_dir.mkdir(exist_ok=True)
-        page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
+        known_sizes = {}
+        metadata_map = {}
+        # Insertion-ordered set of image URLs, deduplicated as they are found
+        candidate_urls = {}
         
+        # Dimensions the page already declares, read in one round-trip
         try:
-            with open(page_source_file, 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            logging.info(f"Saved page source to: {page_source_file}")
+            known_sizes = {src: (width, height) for src, width, height in driver.execute_script(IMAGE_SIZES_JS)}
         except Exception as e:
-            logging.warning(f"Failed to save page source: {e}")
+            logging.debug(f"Failed to read image sizes from page: {e}")
         
-        soup = BeautifulSoup(page_source, 'html.parser')
+        # Template card title/link/text and sizes, read in the browser in one call
+        # and looked up by thumbnail during the walk below
+        cards = harvest_template_cards(driver)
+        if cards:
+            logging.info("Harvested %d template card images in the browser", len(cards))
+        for thumbnail, card in cards.items():
+            if card["width"] and card["height"]:
+                known_sizes.setdefault(thumbnail, (card["width"], card["height"]))
         
-        # Collect all image URLs (no keyword filtering - scoring happens later)
-        image_urls = []
-        metadata_map = {}
+        soup = BeautifulSoup(driver.page_source, 'lxml')
         
-        # Get images from <img> tags
-        for img in soup.find_all('img'):
-            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-            srcset = img.get('srcset') or img.get('data-srcset')
-            
-            if src and not src.startswith('data:'):
-                image_urls.append(src)
-                meta = extract_image_metadata(img, url)
-                if meta.get("thumbnail"):
-                    metadata_map[meta["thumbnail"]] = meta
-            
-            if srcset:
-                srcset_urls = re.findall(r'([^\s,]+(?:\.jpg|\.jpeg|\.png|\.gif|\.webp)[^\s,]*)', srcset, re.IGNORECASE)
-                image_urls.extend(srcset_urls)
-        
-        # Get images from <source> tags
-        for source in soup.find_all('source'):
-            srcset = source.get('srcset') or source.get('data-srcset')
-            src = source.get('src')
-            
-            if srcset:
-                urls = re.findall(r'(https?://[^\s,]+)', srcset)
-                image_urls.extend(urls)
-            
-            if src:
-                image_urls.append(src)
-        
-        # Get images from meta tags (og:image, twitter:image)
-        for tag in soup.find_all(['meta', 'link']):
-            if tag.get('property') in ['og:image', 'twitter:image']:
-                content = tag.get('content')
-                if content:
-                    image_urls.append(content)
-            elif tag.get('rel') == ['image_src']:
-                href = tag.get('href')
-                if href:
-                    image_urls.append(href)
-        
-        # Convert to full URLs, filter by image extension, and remove duplicates
-        full_urls = []
-        for img_url in image_urls:
-            if img_url.startswith('data:'):
-                continue
-            stripped_url = img_url.strip().split()[0]
-            full_url = urljoin(url, stripped_url)
-            
-            # Filter: only include URLs with image extensions
-            if not has_image_extension(full_url):
-                logging.debug(f"Skipping URL without image extension: {full_url}")
-                continue
-            
-            full_urls.append(full_url)
-            if full_url not in metadata_map and img_url in metadata_map:
-                metadata_map[full_url] = metadata_map[img_url]
+        # Collect all image URLs (no keyword filtering - scoring happens later)
+        author_cache = {}
+        for full_url, img_tag in iter_candidate_urls(soup, url):
+            candidate_urls[full_url] = None
+            if img_tag is not None:
+                metadata_map[full_url] = extract_image_metadata(img_tag, url, author_cache, cards.get(full_url))
         
-        # Remove duplicates while preserving order
-        image_urls = list(dict.fromkeys(full_urls))
+        image_urls = list(candidate_urls)
         logging.info("Found %d total images", len(image_urls))
         
-        # Filter images by dimensions (width and height must be > 200px)
-        filtered_urls = []
-        min_size = 200
-        logging.info("Filtering images by dimensions (min %dpx x %dpx)...", min_size, min_size)
-        
-        for idx, img_url in enumerate(image_urls, 1):
-            logging.info("Checking dimensions for %d/%d: %s", idx, len(image_urls), img_url)
-            width, height = check_image_dimensions(driver, img_url, min_size)
-            
-            if (width > min_size and height > min_size) or (width == 0 and height == 0):
-                logging.info("  ✓ Image accepted: %dx%d", width, height)
-                filtered_urls.append(img_url)
-            else:
-                logging.info("  ✗ Image skipped: dimensions too small %dx%d", width, height)
-        
-        image_urls = filtered_urls
-        logging.info("Filtered to %d images with dimensions > %dpx x %dpx", len(image_urls), min_size, min_size)
-        
     finally:
-        driver.quit()
+        release_driver(driver, headless)
     
+    # Load URLs from previous runs so known images are not probed again
     output_dir.mkdir(parents=True, exist_ok=True)
+    metadata_path = migrate_legacy_metadata(output_dir)
+    existing_urls = load_seen_filter(output_dir, metadata_path)
+    existing_count = existing_urls.count
+    logging.info("Loaded ~%d known image URLs", existing_count)
+    
+    # Filter images by dimensions (width and height must be > 200px)
+    filtered_urls = []
+    min_size = 200
+    logging.info("Filtering images by dimensions (min %dpx x %dpx)...", min_size, min_size)
+    
+    stored_urls = {img_url for img_url in image_urls if img_url in existing_urls}
+    logging.info("Skipping dimension check for %d already known images", len(stored_urls))
+    
+    # Sizes read from the page are trusted when they pass the filter; smaller
+    # declared sizes may just be the display size, so those are still probed
+    dimensions = {
+        img_url: known_sizes[img_url]
+        for img_url in image_urls
+        if img_url not in stored_urls and img_url in known_sizes
+        and min(known_sizes[img_url]) > min_size
+    }
+    logging.info("Using page-reported sizes for %d images", len(dimensions))
+    urls_to_probe = [img_url for img_url in image_urls if img_url not in stored_urls and img_url not in dimensions]
+    dimensions.update(probe_dimensions_batch(urls_to_probe, workers=probe_workers))
+    
+    for idx, img_url in enumerate(image_urls, 1):
+        if idx % LOG_PROGRESS_EVERY == 0:
+            logging.info("Checked dimensions for %d/%d images", idx, len(image_urls))
+        if img_url in stored_urls:
+            filtered_urls.append(img_url)
+            continue
+        logging.debug("Checking dimensions for %d/%d: %s", idx, len(image_urls), img_url)
+        width, height = dimensions.get(img_url, (0, 0))
+        
+        if (width > min_size and height > min_size) or (width == 0 and height == 0):
+            logging.debug("  ✓ Image accepted: %dx%d", width, height)
+            filtered_urls.append(img_url)
+        else:
+            logging.debug("  ✗ Image skipped: dimensions too small %dx%d", width, height)
+    
+    image_urls = filtered_urls
+    logging.info("Filtered to %d images with dimensions > %dpx x %dpx", len(image_urls), min_size, min_size)
+    
     collected_metadata = []
     
     for idx, img_url in enumerate(image_urls, 1):
-        logging.info("Collecting metadata for %d/%d: %s", idx, len(image_urls), img_url)
+        logging.debug("Collecting metadata for %d/%d: %s", idx, len(image_urls), img_url)
         meta = metadata_map.get(img_url, {})
         if "thumbnail" not in meta or not meta["thumbnail"]:
             meta = dict(meta)
@@ -384,46 +771,26 @@ def scrape_images_with_js(
     new_metadata_entries = []
     
     if collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
-        
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
-            except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
-        
-        combined_metadata = list(existing_metadata)
         for meta in collected_metadata:
             url = meta.get("thumbnail")
-            if url and url in existing_urls:
+            if url and existing_urls.add(url):
                 continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
             new_metadata_entries.append(meta)
         
+        # Append only the new entries instead of rewriting the whole file
         try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
+            append_metadata(output_dir, new_metadata_entries)
+            # Stamped after the append so the filter matches the file as written
+            existing_urls.source_stamp = _metadata_stamp(metadata_path)
+            existing_urls.save(output_dir / BLOOM_FILENAME)
             logging.info(
                 "Saved metadata for %d new images (total %d) to %s",
                 len(new_metadata_entries),
-                len(combined_metadata),
+                existing_count + len(new_metadata_entries),
                 metadata_path,
             )
         except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
+            logging.warning("Failed to save metadata JSONL: %s", exc)
     else:
         logging.info("No additional metadata collected for images.")
     
@@ -434,7 +801,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Scrape images from JavaScript-rendered webpages"
     )
-    parser.add_argument("url", help="URL to scrape images from")
+    parser.add_argument("urls", nargs="+", help="URL(s) to scrape images from")
     parser.add_argument(
         "--output-dir",
         "-o",
@@ -459,6 +826,23 @@ def main():
         action="store_true",
         help="Disable automatic scrolling for lazy-loaded images"
     )
+    parser.add_argument(
+        "--probe-workers",
+        type=int,
+        default=PROBE_WORKERS,
+        help=f"Concurrent image dimension probes (default: {PROBE_WORKERS})"
+    )
+    parser.add_argument(
+        "--save-page-source",
+        action="store_true",
+        help="Save the rendered page HTML to debug_output/ (always on at DEBUG level)"
+    )
+    parser.add_argument(
+        "--export-json",
+        metavar="PATH",
+        default=None,
+        help="After scraping, also write all stored metadata to PATH as a JSON array"
+    )
     parser.add_argument(
         "--show-browser",
         action="store_true",
@@ -479,21 +863,31 @@ def main():
     
     output_path = Path(args.output_dir)
     
-    new_metadata = scrape_images_with_js(
-        args.url,
-        output_path,
-        keywords=args.keywords,
-        headless=not args.show_browser,
-        wait_time=args.wait_time,
-        scroll=not args.no_scroll,
-    )
+    # One browser is reused for every URL
+    new_metadata = []
+    for url in args.urls:
+        new_metadata.extend(scrape_images_with_js(
+            url,
+            output_path,
+            keywords=args.keywords,
+            headless=not args.show_browser,
+            wait_time=args.wait_time,
+            scroll=not args.no_scroll,
+            probe_workers=args.probe_workers,
+            save_page_source=args.save_page_source,
+        ))
+    
+    if args.export_json:
+        if (output_path / METADATA_FILENAME).exists():
+            count = export_json(output_path, Path(args.export_json))
+            logging.info("Exported %d metadata entries to %s", count, args.export_json)
     
     print(f"\n{'='*60}")
     print(f"SCRAPING COMPLETE")
     print(f"{'='*60}")
-    print(f"Collected image metadata from page")
+    print(f"Collected image metadata from {len(args.urls)} page(s)")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
@@ -5,7 +5,8 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
+import bisect
+import gzip
 import logging
 import os
 import re
@@ -16,11 +17,71 @@ from urllib.parse import urljoin, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+import soupsieve as sv
+
+try:
+    from scripts.image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata, json_dumps_indented, json_loads,
+    )
+    from scripts.driver_pool import get_pooled_driver, release_pooled_driver
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        METADATA_FILENAME, append_new_metadata, json_dumps_indented, json_loads,
+    )
+    from driver_pool import get_pooled_driver, release_pooled_driver
+
+# Requests the scraper never needs: fonts, video and analytics/tracking.
+# Images stay enabled because the dimension check loads them in the page,
+# and stylesheets because Elementor's lazy loading depends on layout.
+BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*hotjar.com*', '*facebook.net*',
+]
+
+# Class names that mark an author/byline element
+AUTHOR_CLASS_RE = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+# srcset candidates from <img> tags, matched by file extension
+SRCSET_IMAGE_RE = re.compile(r'([^\s,]+(?:\.jpg|\.jpeg|\.png|\.gif|\.webp)[^\s,]*)', re.IGNORECASE)
+# srcset candidates from <source> tags, matched as absolute URLs
+SRCSET_URL_RE = re.compile(r'(https?://[^\s,]+)')
+WHITESPACE_RE = re.compile(r"\s+")
+# srcset candidates with an explicit width descriptor, e.g. "hero-1024x576.jpg 1024w"
+SRCSET_WIDTH_RE = re.compile(r'([^\s,]+)\s+(\d+)w')
+
+# Elementor post card selectors, compiled once instead of on every select call
+ELEMENTOR_POST_SELECTOR = sv.compile("article.elementor-post.elementor-grid-item")
+ELEMENTOR_TEXT_BLOCK_SELECTOR = sv.compile("div.elementor-post__text")
+THUMBNAIL_LINK_SELECTOR = sv.compile("a.elementor-post__thumbnail__link[href]")
+TITLE_LINK_SELECTOR = sv.compile("h2.elementor-post__title a[href]")
+TITLE_SELECTOR = sv.compile("h2.elementor-post__title a")
+THUMBNAIL_IMG_SELECTOR = sv.compile(".elementor-post__thumbnail img")
+EXCERPT_SELECTOR = sv.compile(".elementor-post__excerpt")
+
+# Common image extensions
+IMAGE_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
+    '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
+)
+# Any of IMAGE_EXTENSIONS appearing in a query string (some CDNs use this)
+QUERY_IMAGE_EXT_RE = re.compile(r'\.(?:jpe?g|png|gif|webp|bmp|tiff?|heic|heif|avif|jfif)|thumbnail')
+
+# Environment variable naming a Selenium server (Grid or standalone Chrome)
+# to use instead of starting a local chromedriver
+REMOTE_URL_ENV = "SELENIUM_REMOTE_URL"
+
+# Sidecar file in the output directory with probed image sizes from earlier runs
+DIMENSION_CACHE_FILENAME = "image_dimensions_cache.json"
+# Cached sizes older than this are probed again
+DIMENSION_CACHE_MAX_AGE = 7 * 24 * 3600
+# Bytes fetched per image when reading its size from the file header; enough
+# for JPEGs whose EXIF block comes before the frame header
+PROBE_RANGE_BYTES = 16384
 
 
-def setup_driver(headless: bool = True) -> webdriver.Chrome:
-    """Setup Chrome WebDriver with options."""
+def setup_driver(headless: bool = True, remote_url: str = None) -> webdriver.Chrome:
+    """Setup Chrome WebDriver with options, on the Selenium server at remote_url if given."""
     chrome_options = Options()
     if headless:
         chrome_options.add_argument('--headless=new')
@@ -29,32 +90,182 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    # Return from driver.get once the DOM is ready instead of after every
+    # subresource; the wait/scroll steps cover the lazy-loaded content
+    chrome_options.page_load_strategy = 'eager'
+    
+    if remote_url:
+        driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
+    
+    # Block fonts, video and analytics at the network layer; remote drivers
+    # have no CDP access, so they load everything
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.debug(f"Failed to configure request blocking: {e}")
     
-    driver = webdriver.Chrome(options=chrome_options)
     return driver
 
 
+def get_driver(headless: bool = True, remote_url: str = None) -> webdriver.Chrome:
+    """
+    Check out a pooled WebDriver, starting a new one if none is idle.
+    
+    remote_url defaults to the SELENIUM_REMOTE_URL environment variable.
+    """
+    remote_url = remote_url or os.environ.get(REMOTE_URL_ENV)
+    return get_pooled_driver(setup_driver, headless, remote_url)
+
+
+def release_driver(driver: webdriver.Chrome, headless: bool = True, remote_url: str = None) -> None:
+    """Reset a driver's state and return it to the pool for reuse."""
+    remote_url = remote_url or os.environ.get(REMOTE_URL_ENV)
+    release_pooled_driver(driver, setup_driver, headless, remote_url)
+
+
+# Flags the current document before a non-blocking navigation; the flag is
+# gone once the new document has replaced it
+NAVIGATE_FROM_STALE_JS = "window.__scraperStaleDocument = true; window.location.href = arguments[0];"
+NEW_DOCUMENT_JS = "return window.__scraperStaleDocument !== true;"
+
+
+def _wait_for_new_document(driver, timeout: float) -> None:
+    """
+    Wait until a navigation started with NAVIGATE_FROM_STALE_JS has committed.
+    
+    Raises TimeoutException if the previous document is still there after
+    timeout seconds. Script errors while the old page unloads are retried.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import WebDriverException
+    
+    WebDriverWait(
+        driver, timeout, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)
+    ).until(
+        lambda d: d.execute_script(NEW_DOCUMENT_JS),
+        message=f"new page did not load within {timeout} seconds",
+    )
+
+
+def _network_quiet(quiet_ms: int):
+    """WebDriverWait condition: document complete and no new resources for quiet_ms."""
+    state = {"count": None, "since": 0.0}
+    
+    def condition(driver):
+        ready_state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.monotonic()
+        if ready_state != "complete" or count != state["count"]:
+            state["count"] = count
+            state["since"] = now
+            return False
+        return (now - state["since"]) * 1000 >= quiet_ms
+    return condition
+
+
+def _wait_for_quiet(driver, timeout: float, quiet_ms: int = 500) -> None:
+    """Wait up to timeout seconds for the page to finish loading and go quiet."""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(_network_quiet(quiet_ms))
+    except TimeoutException:
+        logging.info("Page still loading after %s seconds, continuing anyway", timeout)
+
+
+def _page_height_changed(last_height: int):
+    """WebDriverWait condition returning the page height once it differs from last_height."""
+    def condition(driver):
+        height = driver.execute_script("return document.body.scrollHeight")
+        return height if height != last_height else False
+    return condition
+
+
 def scroll_page(driver, scroll_pause: float = 2.0, max_scrolls: int = 10):
     """Scroll page to trigger lazy loading."""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
     last_height = driver.execute_script("return document.body.scrollHeight")
     scrolls = 0
     
     while scrolls < max_scrolls:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause)
-        
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        # Return as soon as lazy content grows the page instead of always
+        # sleeping the full pause; stop scrolling once it no longer grows
+        try:
+            new_height = WebDriverWait(driver, scroll_pause, poll_frequency=0.25).until(
+                _page_height_changed(last_height)
+            )
+        except TimeoutException:
             break
         last_height = new_height
         scrolls += 1
         logging.info("Scrolled %d times, page height: %d", scrolls, new_height)
 
 
-def _get_nearby_text(element, max_chars: int = 240) -> str:
+def index_page(soup) -> dict:
+    """
+    Walk the document once and index it for per-image text and author lookups.
+    
+    The index holds every string in document order, each tag's position in
+    that walk, and the author/byline-class tags, so _get_nearby_text and
+    _find_author no longer rescan the tree for every image. It is keyed by
+    id(tag) and only valid while soup is alive.
+    """
+    strings = []
+    string_pos = {}   # id(tag) -> index of the first string after the tag opens
+    spans = {}        # id(tag) -> (start, end) positions of the tag's subtree
+    author_starts = []
+    author_tags = []
+    position = 0
+    spans[id(soup)] = (0, None)
+    
+    stack = [(soup, iter(soup.contents))]
+    while stack:
+        tag, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            start, _ = spans[id(tag)]
+            spans[id(tag)] = (start, position)
+            continue
+        position += 1
+        if isinstance(child, NavigableString):
+            strings.append(child)
+            continue
+        string_pos[id(child)] = len(strings)
+        spans[id(child)] = (position, None)
+        if any(AUTHOR_CLASS_RE.search(cls) for cls in child.get("class") or ()):
+            author_starts.append(position)
+            author_tags.append(child)
+        stack.append((child, iter(child.contents)))
+    
+    return {
+        "strings": strings,
+        "string_pos": string_pos,
+        "spans": spans,
+        "author_starts": author_starts,
+        "author_tags": author_tags,
+        "author_text": {},
+        "ancestor_author": {},
+    }
+
+
+def _get_nearby_text(element, max_chars: int = 240, page_index: dict = None) -> str:
     """Extract nearby text content around an element."""
+    if page_index is not None and id(element) in page_index["string_pos"]:
+        start = page_index["string_pos"][id(element)]
+        following = page_index["strings"][start:start + 6]
+    else:
+        following = element.find_all_next(string=True, limit=6)
     texts = []
-    for sibling in element.find_all_next(string=True, limit=6):
+    for sibling in following:
         stripped = sibling.strip()
         if stripped:
             texts.append(stripped)
@@ -64,107 +275,352 @@ def _get_nearby_text(element, max_chars: int = 240) -> str:
     return snippet[:max_chars] if snippet else ""
 
 
-def _find_author(element):
+def _author_in_ancestor(ancestor, page_index: dict = None) -> str:
+    """Return author text found within a single ancestor, or an empty string."""
+    if page_index is not None and id(ancestor) in page_index["spans"]:
+        # Author-class tags inside the ancestor's subtree, in document order
+        start, end = page_index["spans"][id(ancestor)]
+        first = bisect.bisect_right(page_index["author_starts"], start)
+        last = bisect.bisect_left(page_index["author_starts"], end, lo=first)
+        for candidate in page_index["author_tags"][first:last]:
+            text = page_index["author_text"].get(id(candidate))
+            if text is None:
+                text = page_index["author_text"][id(candidate)] = candidate.get_text(strip=True)
+            if text:
+                return text
+    else:
+        for candidate in ancestor.find_all(True, class_=AUTHOR_CLASS_RE):
+            text = candidate.get_text(strip=True)
+            if text:
+                return text
+    # Look for explicit data-author or itemprop
+    if ancestor.has_attr("data-author"):
+        return ancestor["data-author"].strip()
+    if ancestor.has_attr("itemprop") and "author" in ancestor["itemprop"]:
+        text = ancestor.get_text(strip=True)
+        if text:
+            return text
+    return ""
+
+
+def _find_author(element, page_index: dict = None):
     """Search ancestor tree for an author/byline-like element."""
-    author_patterns = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+    cache = page_index["ancestor_author"] if page_index is not None else None
     for ancestor in element.parents:
         if ancestor is None:
             break
         if ancestor.name in ("body", "html"):
             break
-        for candidate in ancestor.find_all(True, class_=author_patterns):
-            text = candidate.get_text(strip=True)
-            if text:
-                return text
-        # Look for explicit data-author or itemprop
-        if ancestor.has_attr("data-author"):
-            return ancestor["data-author"].strip()
-        if ancestor.has_attr("itemprop") and "author" in ancestor["itemprop"]:
-            text = ancestor.get_text(strip=True)
-            if text:
-                return text
+        author = cache.get(id(ancestor)) if cache is not None else None
+        if author is None:
+            author = _author_in_ancestor(ancestor, page_index)
+            if cache is not None:
+                cache[id(ancestor)] = author
+        if author:
+            return author
     return ""
 
 
+def harvest_authors(driver: webdriver.Chrome) -> dict:
+    """
+    Find the author for every <img> on the page in one in-browser pass.
+    
+    Mirrors _find_author: each ancestor below <body> is checked for an
+    author/byline-class descendant with text, then its own data-author and
+    itemprop="author". Results are cached per ancestor, so images sharing a
+    card share the lookup.
+    
+    Returns:
+        Dict mapping each image's raw src (or data-src/data-lazy-src) to its
+        author text ('' if none, None if images sharing the src disagree);
+        {} if the script fails
+    """
+    script = """
+    const selector = '[class*="author" i], [class*="byline" i], [class*="writer" i], [class*="posted-by" i]';
+    const cache = new Map();
+    
+    // Same as BeautifulSoup's get_text(strip=True): stripped strings joined with nothing
+    function strippedText(el) {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        let text = '';
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const parent = node.parentNode.nodeName;
+            if (parent !== 'SCRIPT' && parent !== 'STYLE') {
+                text += node.nodeValue.trim();
+            }
+        }
+        return text;
+    }
+    
+    function authorIn(ancestor) {
+        for (const candidate of ancestor.querySelectorAll(selector)) {
+            const text = strippedText(candidate);
+            if (text) { return text; }
+        }
+        if (ancestor.hasAttribute('data-author')) {
+            return ancestor.getAttribute('data-author').trim();
+        }
+        const itemprop = ancestor.getAttribute('itemprop');
+        if (itemprop && itemprop.split(/\s+/).includes('author')) {
+            return strippedText(ancestor);
+        }
+        return '';
+    }
+    
+    const out = {};
+    for (const img of document.querySelectorAll('img')) {
+        const key = img.getAttribute('src') || img.getAttribute('data-src') || img.getAttribute('data-lazy-src');
+        if (!key) { continue; }
+        let author = '';
+        for (let el = img.parentElement; el && el !== document.body && el !== document.documentElement; el = el.parentElement) {
+            if (!cache.has(el)) { cache.set(el, authorIn(el)); }
+            author = cache.get(el);
+            if (author) { break; }
+        }
+        // Images sharing a src with different authors are left to the soup search
+        out[key] = (key in out && out[key] !== author) ? null : author;
+    }
+    return out;
+    """
+    try:
+        return driver.execute_script(script) or {}
+    except Exception as e:
+        logging.debug(f"Failed to harvest authors in the browser: {e}")
+        return {}
+
+
 def has_image_extension(url: str) -> bool:
     """Check if URL contains an image file extension."""
     if not url:
         return False
     
-    # Common image extensions
-    image_extensions = [
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
-        '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
-    ]
-    
     # Parse URL and check path
     parsed = urlparse(url)
     path = parsed.path.lower()
     
-    # Check if path ends with image extension
-    for ext in image_extensions:
-        if path.endswith(ext):
-            return True
+    # Check if path ends with image extension, then the query parameters
+    if path.endswith(IMAGE_EXTENSIONS):
+        return True
+    return QUERY_IMAGE_EXT_RE.search(parsed.query.lower()) is not None
+
+
+def declared_image_sizes(attrs: dict, base_url: str) -> dict:
+    """
+    Read the sizes an <img> tag declares for its image URLs.
     
-    # Also check query parameters for image extensions (some CDNs use this)
-    query = parsed.query.lower()
-    for ext in image_extensions:
-        if ext in query:
-            return True
+    The width/height attributes give the size of src; srcset width
+    descriptors give the width of each candidate, with the height scaled
+    by the aspect ratio of the width/height attributes.
     
-    return False
+    Returns:
+        Dict mapping absolute image URL to (width, height)
+    """
+    sizes = {}
+    width = attrs.get("width", "").strip()
+    height = attrs.get("height", "").strip()
+    if not (width.isdigit() and height.isdigit() and int(width) and int(height)):
+        return sizes
+    width, height = int(width), int(height)
+    
+    src = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src")
+    if src and not src.startswith("data:"):
+        sizes[urljoin(base_url, src.strip())] = (width, height)
+    
+    srcset = attrs.get("srcset") or attrs.get("data-srcset")
+    if srcset:
+        for candidate, descriptor in SRCSET_WIDTH_RE.findall(srcset):
+            if candidate.startswith("data:"):
+                continue
+            candidate_width = int(descriptor)
+            sizes[urljoin(base_url, candidate)] = (candidate_width, round(candidate_width * height / width))
+    return sizes
 
 
-def check_image_dimensions(driver: webdriver.Chrome, img_url: str, min_size: int = 200) -> tuple:
+def loaded_image_urls(driver: webdriver.Chrome) -> list:
     """
-    Check if an image has width and height greater than min_size.
+    List the images the current tab has already loaded, from Chrome's resource tree.
+    
+    This catches images added by JavaScript (sliders, background loaders) that
+    never appear as <img> markup. Returns [] when CDP is unavailable.
+    """
+    try:
+        tree = driver.execute_cdp_cmd('Page.getResourceTree', {})
+    except Exception as e:
+        logging.debug(f"Failed to read resource tree: {e}")
+        return []
+    
+    urls = []
+    frames = [tree['frameTree']]
+    while frames:
+        frame = frames.pop()
+        for resource in frame.get('resources', ()):
+            if resource.get('type') == 'Image' and not resource['url'].startswith('data:'):
+                urls.append(resource['url'])
+        frames.extend(frame.get('childFrames', ()))
+    return urls
+
+
+def check_image_dimensions_batch(driver: webdriver.Chrome, img_urls: list, timeout_ms: int = 8000) -> list:
+    """
+    Probe every image in the browser concurrently and return their dimensions.
+    
+    Each image is first fetched with a Range request and its size read from
+    the PNG, GIF, WebP or JPEG header; images whose header cannot be read
+    (CORS, unknown format, a JPEG header beyond the range) are loaded in
+    full through an Image() element instead.
     
     Args:
         driver: Selenium WebDriver instance
-        img_url: URL of the image to check
-        min_size: Minimum width and height in pixels (default: 200)
+        img_urls: URLs of the images to check
+        timeout_ms: Overall time limit for probing all images
     
     Returns:
-        Tuple of (width, height) if image is valid, (0, 0) otherwise
+        List of (width, height) in the same order as img_urls; (0, 0) for
+        images that failed to load, None for images that had not settled by
+        the timeout
     """
-    try:
-        # Use JavaScript to load and check image dimensions
-        # execute_async_script requires callback as last argument
-        script = """
+    if not img_urls:
+        return []
+    
+    # One async script starts all probes at once and calls back when every
+    # image has settled or the single overall timeout fires
+    script = """
+    const urls = arguments[0];
+    const rangeBytes = arguments[2];
+    const callback = arguments[arguments.length - 1];
+    // Entries still null when the timer fires had not settled
+    const out = urls.map(function() { return null; });
+    let done = 0;
+    let finished = false;
+    
+    function finish() {
+        if (!finished) {
+            finished = true;
+            callback(out);
+        }
+    }
+    const timer = setTimeout(finish, arguments[1]);
+    
+    function settle() {
+        if (++done === urls.length) { clearTimeout(timer); finish(); }
+    }
+    
+    function be16(b, i) { return (b[i] << 8) | b[i + 1]; }
+    function le16(b, i) { return b[i] | (b[i + 1] << 8); }
+    function le24(b, i) { return b[i] | (b[i + 1] << 8) | (b[i + 2] << 16); }
+    
+    // Read [width, height] from the first bytes of an image, or null
+    function parseDims(b) {
+        if (b.length >= 24 && b[0] === 0x89 && b[1] === 0x50 && b[2] === 0x4E && b[3] === 0x47) {
+            return [be16(b, 16) * 65536 + be16(b, 18), be16(b, 20) * 65536 + be16(b, 22)];
+        }
+        if (b.length >= 10 && b[0] === 0x47 && b[1] === 0x49 && b[2] === 0x46) {
+            return [le16(b, 6), le16(b, 8)];
+        }
+        if (b.length >= 30 && String.fromCharCode(b[0], b[1], b[2], b[3]) === 'RIFF'
+                && String.fromCharCode(b[8], b[9], b[10], b[11]) === 'WEBP') {
+            const chunk = String.fromCharCode(b[12], b[13], b[14], b[15]);
+            if (chunk === 'VP8 ') {
+                return [le16(b, 26) & 0x3FFF, le16(b, 28) & 0x3FFF];
+            }
+            if (chunk === 'VP8L') {
+                return [1 + (((b[22] & 0x3F) << 8) | b[21]),
+                        1 + (((b[24] & 0x0F) << 10) | (b[23] << 2) | ((b[22] & 0xC0) >> 6))];
+            }
+            if (chunk === 'VP8X') {
+                return [1 + le24(b, 24), 1 + le24(b, 27)];
+            }
+            return null;
+        }
+        if (b.length >= 4 && b[0] === 0xFF && b[1] === 0xD8) {
+            let i = 2;
+            while (i + 9 < b.length) {
+                if (b[i] !== 0xFF) { i++; continue; }
+                const marker = b[i + 1];
+                if (marker === 0xFF) { i++; continue; }
+                // SOFn frame headers hold the size; C4, C8 and CC are not frames
+                if (marker >= 0xC0 && marker <= 0xCF && marker !== 0xC4 && marker !== 0xC8 && marker !== 0xCC) {
+                    return [be16(b, i + 7), be16(b, i + 5)];
+                }
+                if (marker === 0x01 || (marker >= 0xD0 && marker <= 0xD8)) { i += 2; continue; }
+                i += 2 + be16(b, i + 2);
+            }
+        }
+        return null;
+    }
+    
+    // Read at most rangeBytes of the body, even if the server ignores Range
+    function readHead(response) {
+        if (!response.ok) { throw new Error('HTTP ' + response.status); }
+        const reader = response.body.getReader();
+        const head = new Uint8Array(rangeBytes);
+        let size = 0;
+        function pump() {
+            return reader.read().then(function(result) {
+                if (!result.done && size < rangeBytes) {
+                    const chunk = result.value.subarray(0, rangeBytes - size);
+                    head.set(chunk, size);
+                    size += chunk.length;
+                    if (size < rangeBytes) { return pump(); }
+                }
+                reader.cancel();
+                return head.subarray(0, size);
+            });
+        }
+        return pump();
+    }
+    
+    function loadImage(url, i) {
         const img = new Image();
         img.crossOrigin = 'anonymous';
-        const url = arguments[0];
-        const callback = arguments[arguments.length - 1];
-        
         img.onload = function() {
-            callback({width: this.naturalWidth, height: this.naturalHeight});
+            out[i] = [img.naturalWidth, img.naturalHeight];
+            settle();
         };
         img.onerror = function() {
-            callback({width: 0, height: 0});
+            out[i] = [0, 0];
+            settle();
         };
-        
         img.src = url;
-        
-        // Timeout after 5 seconds
-        setTimeout(function() {
-            callback({width: 0, height: 0});
-        }, 5000);
-        """
-        dimensions = driver.execute_async_script(script, img_url)
-        width = dimensions.get('width', 0)
-        height = dimensions.get('height', 0)
-        
-        return (width, height)
+    }
+    
+    urls.forEach(function(url, i) {
+        fetch(url, {headers: {'Range': 'bytes=0-' + (rangeBytes - 1)}})
+            .then(readHead)
+            .then(function(head) {
+                const dims = parseDims(head);
+                if (dims && dims[0] && dims[1]) {
+                    out[i] = dims;
+                    settle();
+                } else {
+                    loadImage(url, i);
+                }
+            })
+            .catch(function() { loadImage(url, i); });
+    });
+    """
+    try:
+        driver.set_script_timeout(timeout_ms / 1000 + 5)
+        sizes = driver.execute_async_script(script, img_urls, timeout_ms, PROBE_RANGE_BYTES)
+        return [tuple(size) if size is not None else None for size in sizes]
     except Exception as e:
-        logging.debug(f"Failed to check dimensions for {img_url}: {e}")
-        return (0, 0)
+        logging.debug(f"Failed to check dimensions for {len(img_urls)} images: {e}")
+        return [(0, 0)] * len(img_urls)
 
 
-def extract_image_metadata(img_tag, base_url: str) -> dict:
-    """Derive contextual metadata for an image tag."""
+def extract_image_metadata(img_tag, base_url: str, page_index: dict = None, author_map: dict = None) -> dict:
+    """
+    Derive contextual metadata for an image tag.
+    
+    Pass the index_page() result for the image's soup to avoid rescanning
+    the document for every image, and the harvest_authors() result to take
+    the author from the browser; images missing from author_map fall back
+    to searching the soup.
+    """
     metadata = {}
+    attrs = img_tag.attrs
     
-    src = img_tag.get("src") or img_tag.get("data-src") or img_tag.get("data-lazy-src")
+    src = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src")
     if src:
         metadata["thumbnail"] = urljoin(base_url, src.strip())
     else:
@@ -176,25 +632,22 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
     else:
         metadata["source_link"] = ""
     
-    title = img_tag.get("alt") or img_tag.get("title")
-    if not title:
-        # Check parent figure or caption
-        figure = img_tag.find_parent("figure")
-        if figure:
-            caption = figure.find("figcaption")
-            if caption:
-                title = caption.get_text(strip=True)
+    # Parent figure caption, looked up once for both title and extra_text
+    figure = img_tag.find_parent("figure")
+    caption = figure.find("figcaption") if figure else None
+    
+    title = attrs.get("alt") or attrs.get("title")
+    if not title and caption:
+        title = caption.get_text(strip=True)
     metadata["title"] = title or ""
     
-    metadata["author"] = _find_author(img_tag)
+    if author_map is not None and author_map.get(src) is not None:
+        metadata["author"] = author_map[src]
+    else:
+        metadata["author"] = _find_author(img_tag, page_index)
     
-    figure = img_tag.find_parent("figure")
-    caption_text = ""
-    if figure:
-        caption = figure.find("figcaption")
-        if caption:
-            caption_text = caption.get_text(" ", strip=True)
-    nearby_text = _get_nearby_text(img_tag)
+    caption_text = caption.get_text(" ", strip=True) if caption else ""
+    nearby_text = _get_nearby_text(img_tag, page_index=page_index)
     
     metadata["extra_text"] = caption_text or nearby_text
     
@@ -205,10 +658,10 @@ def _normalize_spaces(text: str) -> str:
     """Collapse all runs of whitespace into single spaces and trim."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
 
 
-def extract_elementor_posts(soup: BeautifulSoup, base_url: str) -> list:
+def extract_elementor_posts(soup: BeautifulSoup, base_url: str, known_dims: dict = None) -> list:
     """
     Extract metadata from Elementor post cards like:
     <article class="elementor-post elementor-grid-item ...">
@@ -216,31 +669,36 @@ def extract_elementor_posts(soup: BeautifulSoup, base_url: str) -> list:
       - source_link: a[href] around thumbnail/title
       - title: h2.elementor-post__title a text
       - extra_text: div.elementor-post__excerpt p text
+    
+    Sizes declared by the thumbnail <img> tags are added to known_dims if given.
     """
     results = []
-    for article in soup.select("article.elementor-post.elementor-grid-item"):
+    for article in ELEMENTOR_POST_SELECTOR.select(soup):
         # Source link from thumbnail or title
-        link_tag = article.select_one("a.elementor-post__thumbnail__link[href]") or article.select_one("h2.elementor-post__title a[href]")
+        link_tag = THUMBNAIL_LINK_SELECTOR.select_one(article) or TITLE_LINK_SELECTOR.select_one(article)
         source_link = urljoin(base_url, link_tag["href"].strip()) if link_tag and link_tag.has_attr("href") else ""
 
         # Thumbnail - extract from img tag, never use source_link if img tag exists
-        img_tag = article.select_one(".elementor-post__thumbnail img")
+        img_tag = THUMBNAIL_IMG_SELECTOR.select_one(article)
         thumbnail = ""
         img_tag_found = img_tag is not None
         
         if img_tag:
+            attrs = img_tag.attrs
+            if known_dims is not None:
+                known_dims.update(declared_image_sizes(attrs, base_url))
             # Handle srcset first - extract the largest image URL if srcset exists
-            srcset = img_tag.get("srcset") or img_tag.get("data-srcset")
+            srcset = attrs.get("srcset") or attrs.get("data-srcset")
             if srcset:
                 # Extract URLs from srcset (format: "url1 size1, url2 size2")
-                srcset_urls = re.findall(r'([^\s,]+(?:\.jpg|\.jpeg|\.png|\.gif|\.webp)[^\s,]*)', srcset, re.IGNORECASE)
+                srcset_urls = SRCSET_IMAGE_RE.findall(srcset)
                 if srcset_urls:
                     # Use the largest image (usually the last one in srcset)
                     thumbnail = urljoin(base_url, srcset_urls[-1].strip())
             
             # If no thumbnail from srcset, try src attribute and other data attributes
             if not thumbnail:
-                src = img_tag.get("src") or img_tag.get("data-src") or img_tag.get("data-lazy-src") or img_tag.get("data-original")
+                src = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src") or attrs.get("data-original")
                 if src and src.strip() and not src.startswith('data:'):
                     thumbnail = urljoin(base_url, src.strip())
         
@@ -250,12 +708,12 @@ def extract_elementor_posts(soup: BeautifulSoup, base_url: str) -> list:
             thumbnail = source_link
 
         # Title
-        title_tag = article.select_one("h2.elementor-post__title a")
+        title_tag = TITLE_SELECTOR.select_one(article)
         raw_title = title_tag.get_text(" ", strip=True) if title_tag else ""
         title = _normalize_spaces(raw_title)
 
         # Excerpt
-        excerpt_tag = article.select_one(".elementor-post__excerpt")
+        excerpt_tag = EXCERPT_SELECTOR.select_one(article)
         raw_excerpt = excerpt_tag.get_text(" ", strip=True) if excerpt_tag else ""
         extra_text = _normalize_spaces(raw_excerpt)
 
@@ -280,14 +738,14 @@ def extract_elementor_text_blocks(soup: BeautifulSoup, base_url: str) -> list:
     Uses the link as both source_link and thumbnail placeholder.
     """
     results = []
-    for text_block in soup.select("div.elementor-post__text"):
-        title_tag = text_block.select_one("h2.elementor-post__title a[href]")
+    for text_block in ELEMENTOR_TEXT_BLOCK_SELECTOR.select(soup):
+        title_tag = TITLE_LINK_SELECTOR.select_one(text_block)
         source_link = urljoin(base_url, title_tag["href"].strip()) if title_tag and title_tag.has_attr("href") else ""
 
         raw_title = title_tag.get_text(" ", strip=True) if title_tag else ""
         title = _normalize_spaces(raw_title)
 
-        excerpt_tag = text_block.select_one(".elementor-post__excerpt")
+        excerpt_tag = EXCERPT_SELECTOR.select_one(text_block)
         raw_excerpt = excerpt_tag.get_text(" ", strip=True) if excerpt_tag else ""
         extra_text = _normalize_spaces(raw_excerpt)
 
@@ -302,173 +760,208 @@ def extract_elementor_text_blocks(soup: BeautifulSoup, base_url: str) -> list:
     return results
 
 
-def scrape_images_with_js(
+def _save_page_source(page_source: str) -> None:
+    """Write the rendered HTML, gzipped, to a timestamped file in debug_output/."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    debug_dir = Path("debug_output")
+    debug_dir.mkdir(exist_ok=True)
+    page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html.gz"
+    
+    try:
+        with gzip.open(page_source_file, 'wt', encoding='utf-8', compresslevel=1) as f:
+            f.write(page_source)
+        logging.info(f"Saved page source to: {page_source_file}")
+    except Exception as e:
+        logging.warning(f"Failed to save page source: {e}")
+
+
+def _extract_page_images(
+    driver: webdriver.Chrome,
     url: str,
-    output_dir: Path,
-    keywords: list = None,
-    headless: bool = True,
-    wait_time: int = 5,
-    scroll: bool = True,
-) -> list:
+    dim_cache: dict = None,
+    save_page_source: bool = False,
+) -> tuple:
     """
-    Scrape ALL images from JavaScript-rendered page.
+    Collect candidate images from the page currently loaded in the driver.
     
-    Args:
-        url: URL to scrape
-        output_dir: Directory to save images
-        keywords: (Unused - kept for backwards compatibility)
-        headless: Run browser in headless mode
-        wait_time: Seconds to wait for JavaScript to load
-        scroll: Whether to scroll page for lazy-loaded images
+    Sizes found in dim_cache are used instead of probing, and newly probed
+    sizes are added to it. The page HTML is saved to debug_output/ when
+    save_page_source is set or DEBUG logging is enabled.
     
     Returns:
-        List of saved file paths
+        Tuple of (image_urls, metadata_map, elementor_entries) where image_urls
+        have passed the extension and dimension filters
     """
-    logging.info("Starting browser and loading: %s", url)
+    page_source = driver.page_source
+    author_map = harvest_authors(driver)
     
-    driver = setup_driver(headless)
+    if save_page_source or logging.getLogger().isEnabledFor(logging.DEBUG):
+        _save_page_source(page_source)
     
-    try:
-        driver.get(url)
-        
-        logging.info("Waiting %d seconds for JavaScript to load...", wait_time)
-        time.sleep(wait_time)
-        
-        if scroll:
-            logging.info("Scrolling page to load lazy images...")
-            scroll_page(driver)
-        
-        page_source = driver.page_source
-        
-        # Save page source for debugging
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_dir = Path("debug_output")
-        debug_dir.mkdir(exist_ok=True)
-        page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
-        
-        try:
-            with open(page_source_file, 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            logging.info(f"Saved page source to: {page_source_file}")
-        except Exception as e:
-            logging.warning(f"Failed to save page source: {e}")
-        
-        soup = BeautifulSoup(page_source, 'html.parser')
+    soup = BeautifulSoup(page_source, 'lxml')
+    
+    # Collect all image URLs (no keyword filtering - scoring happens later).
+    # Each candidate is resolved and deduplicated where it is found, so
+    # repeated srcset entries skip the extension check.
+    image_urls = []
+    seen = set()
+    metadata_map = {}
+    elementor_entries_list = []
+    # Sizes the page declares for its images, so those need no probe
+    known_dims = {}
+    
+    # Resolves a candidate, records it and returns the absolute URL that
+    # metadata_map is keyed on (None for data: URIs and blank values)
+    def add_candidate(img_url):
+        if img_url.startswith('data:'):
+            return None
+        parts = img_url.strip().split()
+        if not parts:
+            return None
+        full_url = urljoin(url, parts[0])
+        if full_url in seen:
+            return full_url
+        seen.add(full_url)
         
-        # Collect all image URLs (no keyword filtering - scoring happens later)
-        image_urls = []
-        metadata_map = {}
-        elementor_entries_list = []
+        # Filter: only include URLs with image extensions
+        if not has_image_extension(full_url):
+            logging.debug(f"Skipping URL without image extension: {full_url}")
+            return full_url
+        image_urls.append(full_url)
+        return full_url
 
-        # Special handling: Elementor post cards (Porter Metrics templates/blog)
-        try:
-            elementor_entries = extract_elementor_posts(soup, url)
-            for entry in elementor_entries:
-                thumb = entry.get("thumbnail", "")
-                if thumb:
-                    metadata_map[thumb] = entry
-                    image_urls.append(thumb)
-            elementor_entries_list = elementor_entries
-        except Exception as e:
-            logging.debug(f"Elementor parsing skipped due to error: {e}")
-
-        # Fallback: handle cards that only include the text block (no outer article)
-        try:
-            text_block_entries = extract_elementor_text_blocks(soup, url)
-            for entry in text_block_entries:
-                thumb = entry.get("thumbnail", "")
-                if thumb:
-                    # Do not enforce image extension; include as metadata-only entry later
-                    if thumb not in metadata_map:
-                        metadata_map[thumb] = entry
-                    # Also add to image_urls so we attempt to keep it through the flow;
-                    # if filtered out later by extension/dimension steps, we will still merge it after.
-                    image_urls.append(thumb)
-            elementor_entries_list.extend(text_block_entries)
-        except Exception as e:
-            logging.debug(f"Elementor text-block parsing skipped due to error: {e}")
-        
-        # Get images from <img> tags
-        for img in soup.find_all('img'):
-            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-            srcset = img.get('srcset') or img.get('data-srcset')
-            
-            if src and not src.startswith('data:'):
-                image_urls.append(src)
-                meta = extract_image_metadata(img, url)
-                if meta.get("thumbnail"):
-                    metadata_map[meta["thumbnail"]] = meta
-            
-            if srcset:
-                srcset_urls = re.findall(r'([^\s,]+(?:\.jpg|\.jpeg|\.png|\.gif|\.webp)[^\s,]*)', srcset, re.IGNORECASE)
-                image_urls.extend(srcset_urls)
-        
-        # Get images from <source> tags
-        for source in soup.find_all('source'):
-            srcset = source.get('srcset') or source.get('data-srcset')
-            src = source.get('src')
-            
-            if srcset:
-                urls = re.findall(r'(https?://[^\s,]+)', srcset)
-                image_urls.extend(urls)
-            
-            if src:
-                image_urls.append(src)
-        
-        # Get images from meta tags (og:image, twitter:image)
-        for tag in soup.find_all(['meta', 'link']):
-            if tag.get('property') in ['og:image', 'twitter:image']:
-                content = tag.get('content')
-                if content:
-                    image_urls.append(content)
-            elif tag.get('rel') == ['image_src']:
-                href = tag.get('href')
-                if href:
-                    image_urls.append(href)
-        
-        # Convert to full URLs, filter by image extension, and remove duplicates
-        full_urls = []
-        for img_url in image_urls:
-            if img_url.startswith('data:'):
-                continue
-            stripped_url = img_url.strip().split()[0]
-            full_url = urljoin(url, stripped_url)
-            
-            # Filter: only include URLs with image extensions
-            if not has_image_extension(full_url):
-                logging.debug(f"Skipping URL without image extension: {full_url}")
-                continue
-            
-            full_urls.append(full_url)
-            if full_url not in metadata_map and img_url in metadata_map:
-                metadata_map[full_url] = metadata_map[img_url]
-        
-        # Remove duplicates while preserving order
-        image_urls = list(dict.fromkeys(full_urls))
-        logging.info("Found %d total images", len(image_urls))
+    # Special handling: Elementor post cards (Porter Metrics templates/blog)
+    try:
+        elementor_entries = extract_elementor_posts(soup, url, known_dims)
+        for entry in elementor_entries:
+            thumb = entry.get("thumbnail", "")
+            full_url = add_candidate(thumb) if thumb else None
+            if full_url:
+                metadata_map[full_url] = entry
+        elementor_entries_list = elementor_entries
+    except Exception as e:
+        logging.debug(f"Elementor parsing skipped due to error: {e}")
+
+    # Fallback: handle cards that only include the text block (no outer article)
+    try:
+        text_block_entries = extract_elementor_text_blocks(soup, url)
+        for entry in text_block_entries:
+            thumb = entry.get("thumbnail", "")
+            # Also add to image_urls so we attempt to keep it through the flow;
+            # if filtered out later by extension/dimension steps, we will still merge it after.
+            full_url = add_candidate(thumb) if thumb else None
+            # Do not enforce image extension; include as metadata-only entry later
+            if full_url and full_url not in metadata_map:
+                metadata_map[full_url] = entry
+        elementor_entries_list.extend(text_block_entries)
+    except Exception as e:
+        logging.debug(f"Elementor text-block parsing skipped due to error: {e}")
+    
+    # Get images from <img> tags
+    page_index = index_page(soup)
+    for img in soup.find_all('img'):
+        attrs = img.attrs
+        src = attrs.get('src') or attrs.get('data-src') or attrs.get('data-lazy-src')
+        srcset = attrs.get('srcset') or attrs.get('data-srcset')
+        known_dims.update(declared_image_sizes(attrs, url))
         
-        # Filter images by dimensions (width and height must be > 200px)
-        filtered_urls = []
-        min_size = 200
-        logging.info("Filtering images by dimensions (min %dpx x %dpx)...", min_size, min_size)
+        if src and not src.startswith('data:'):
+            meta = extract_image_metadata(img, url, page_index, author_map)
+            full_url = add_candidate(src)
+            if full_url and meta.get("thumbnail"):
+                metadata_map[full_url] = meta
         
-        for idx, img_url in enumerate(image_urls, 1):
-            logging.info("Checking dimensions for %d/%d: %s", idx, len(image_urls), img_url)
-            width, height = check_image_dimensions(driver, img_url, min_size)
-            
-            if (width > min_size and height > min_size) or (width == 0 and height == 0):
-                logging.info("  ✓ Image accepted: %dx%d", width, height)
-                filtered_urls.append(img_url)
-            else:
-                logging.info("  ✗ Image skipped: dimensions too small %dx%d", width, height)
+        if srcset:
+            for srcset_url in SRCSET_IMAGE_RE.findall(srcset):
+                add_candidate(srcset_url)
+    
+    # Get images from <source> tags
+    for source in soup.find_all('source'):
+        srcset = source.get('srcset') or source.get('data-srcset')
+        src = source.get('src')
         
-        image_urls = filtered_urls
-        logging.info("Filtered to %d images with dimensions > %dpx x %dpx", len(image_urls), min_size, min_size)
+        if srcset:
+            for srcset_url in SRCSET_URL_RE.findall(srcset):
+                add_candidate(srcset_url)
         
-    finally:
-        driver.quit()
+        if src:
+            add_candidate(src)
     
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Get images from meta tags (og:image, twitter:image)
+    for tag in soup.find_all(['meta', 'link']):
+        if tag.get('property') in ['og:image', 'twitter:image']:
+            content = tag.get('content')
+            if content:
+                add_candidate(content)
+        elif tag.get('rel') == ['image_src']:
+            href = tag.get('href')
+            if href:
+                add_candidate(href)
+    
+    # Images the browser fetched that the markup does not reference
+    for loaded_url in loaded_image_urls(driver):
+        add_candidate(loaded_url)
+    
+    logging.info("Found %d total images", len(image_urls))
+    
+    # Filter images by dimensions (width and height must be > 200px)
+    filtered_urls = []
+    min_size = 200
+    logging.info("Filtering images by dimensions (min %dpx x %dpx)...", min_size, min_size)
+    
+    # Declared sizes are trusted when they pass the filter; smaller declared
+    # sizes may just be the display size, so those are still probed
+    dimensions = {
+        img_url: known_dims[img_url]
+        for img_url in image_urls
+        if img_url in known_dims and min(known_dims[img_url]) > min_size
+    }
+    logging.info("Using declared sizes for %d images", len(dimensions))
+    if dim_cache is None:
+        dim_cache = {}
+    cached = {
+        img_url: (dim_cache[img_url]["width"], dim_cache[img_url]["height"])
+        for img_url in image_urls
+        if img_url not in dimensions and img_url in dim_cache
+    }
+    logging.info("Using cached sizes for %d images", len(cached))
+    dimensions.update(cached)
+    
+    urls_to_probe = [img_url for img_url in image_urls if img_url not in dimensions]
+    probed = dict(zip(urls_to_probe, check_image_dimensions_batch(driver, urls_to_probe)))
+    # Images that had not settled when the batch timed out get one more try on
+    # their own; any still unsettled after that are rejected below
+    timed_out = [img_url for img_url, size in probed.items() if size is None]
+    if timed_out:
+        logging.info("Probing %d images again after the size check timed out", len(timed_out))
+        probed.update(zip(timed_out, check_image_dimensions_batch(driver, timed_out)))
+    now = time.time()
+    for img_url, size in probed.items():
+        dimensions[img_url] = size
+        # Failed loads report 0x0 and are retried on the next run
+        if size is not None and (size[0] or size[1]):
+            dim_cache[img_url] = {"width": size[0], "height": size[1], "ts": now}
+    
+    for idx, img_url in enumerate(image_urls, 1):
+        logging.info("Checking dimensions for %d/%d: %s", idx, len(image_urls), img_url)
+        if dimensions[img_url] is None:
+            logging.info("  ✗ Image skipped: size check timed out")
+            continue
+        width, height = dimensions[img_url]
+        if (width > min_size and height > min_size) or (width == 0 and height == 0):
+            logging.info("  ✓ Image accepted: %dx%d", width, height)
+            filtered_urls.append(img_url)
+        else:
+            logging.info("  ✗ Image skipped: dimensions too small %dx%d", width, height)
+    
+    image_urls = filtered_urls
+    logging.info("Filtered to %d images with dimensions > %dpx x %dpx", len(image_urls), min_size, min_size)
+    
+    return image_urls, metadata_map, elementor_entries_list
+
+
+def _build_metadata(image_urls: list, metadata_map: dict, elementor_entries_list: list) -> list:
+    """Build the metadata entries for one page's accepted images and Elementor cards."""
     collected_metadata = []
     
     for idx, img_url in enumerate(image_urls, 1):
@@ -494,62 +987,173 @@ def scrape_images_with_js(
     except Exception as e:
         logging.debug(f"Failed to merge Elementor-only entries: {e}")
     
+    return collected_metadata
+
+
+def load_dimension_cache(output_dir: Path) -> dict:
+    """
+    Load probed image sizes from earlier runs, dropping expired entries.
+    
+    Returns:
+        Dict mapping image URL to {"width", "height", "ts"}
+    """
+    cache_path = output_dir / DIMENSION_CACHE_FILENAME
+    if not cache_path.exists():
+        return {}
+    try:
+        cache = json_loads(cache_path.read_bytes())
+    except Exception as exc:
+        logging.warning("Failed to read dimension cache: %s", exc)
+        return {}
+    cutoff = time.time() - DIMENSION_CACHE_MAX_AGE
+    cache = {url: entry for url, entry in cache.items() if entry.get("ts", 0) > cutoff}
+    logging.info("Loaded %d cached image sizes", len(cache))
+    return cache
+
+
+def save_dimension_cache(output_dir: Path, dim_cache: dict) -> None:
+    """Write the probed image sizes to the sidecar cache file."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        (output_dir / DIMENSION_CACHE_FILENAME).write_bytes(json_dumps_indented(dim_cache))
+    except Exception as exc:
+        logging.warning("Failed to save dimension cache: %s", exc)
+
+
+def _save_metadata(output_dir: Path, collected_metadata: list) -> list:
+    """Append new collected metadata to image_metadata.jsonl; returns the newly added entries."""
     logging.info("Collected metadata for %d images", len(collected_metadata))
+    if not collected_metadata:
+        logging.info("No additional metadata collected for images.")
+        return []
+    return append_new_metadata(output_dir, collected_metadata)
+
+
+def scrape_images_with_js(
+    url: str,
+    output_dir: Path,
+    keywords: list = None,
+    headless: bool = True,
+    wait_time: int = 5,
+    scroll: bool = True,
+    save_page_source: bool = False,
+    remote_url: str = None,
+) -> list:
+    """
+    Scrape ALL images from JavaScript-rendered page.
     
-    new_metadata_entries = []
+    Args:
+        url: URL to scrape
+        output_dir: Directory to save images
+        keywords: (Unused - kept for backwards compatibility)
+        headless: Run browser in headless mode
+        wait_time: Seconds to wait for JavaScript to load
+        scroll: Whether to scroll page for lazy-loaded images
+        save_page_source: Save the rendered HTML to debug_output/
+        remote_url: Selenium server to run the browser on (default: SELENIUM_REMOTE_URL)
     
-    if collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
+    Returns:
+        List of saved file paths
+    """
+    logging.info("Starting browser and loading: %s", url)
+    
+    dim_cache = load_dimension_cache(output_dir)
+    driver = get_driver(headless, remote_url)
+    
+    try:
+        driver.get(url)
         
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
-            except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
+        logging.info("Waiting up to %d seconds for JavaScript to load...", wait_time)
+        _wait_for_quiet(driver, wait_time)
         
-        combined_metadata = list(existing_metadata)
-        for meta in collected_metadata:
-            url = meta.get("thumbnail")
-            if url and url in existing_urls:
-                continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
-            new_metadata_entries.append(meta)
+        if scroll:
+            logging.info("Scrolling page to load lazy images...")
+            scroll_page(driver)
         
-        try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
-            logging.info(
-                "Saved metadata for %d new images (total %d) to %s",
-                len(new_metadata_entries),
-                len(combined_metadata),
-                metadata_path,
-            )
-        except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
-    else:
-        logging.info("No additional metadata collected for images.")
+        image_urls, metadata_map, elementor_entries_list = _extract_page_images(driver, url, dim_cache, save_page_source)
+        
+    finally:
+        release_driver(driver, headless, remote_url)
+        save_dimension_cache(output_dir, dim_cache)
+    
+    collected_metadata = _build_metadata(image_urls, metadata_map, elementor_entries_list)
+    return _save_metadata(output_dir, collected_metadata)
+
+
+def scrape_images_with_js_batch(
+    urls: list,
+    output_dir: Path,
+    headless: bool = True,
+    wait_time: int = 5,
+    scroll: bool = True,
+    max_tabs: int = 4,
+    save_page_source: bool = False,
+    remote_url: str = None,
+) -> list:
+    """
+    Scrape several pages with one browser, loading up to max_tabs pages at once.
+    
+    Each group of pages is navigated in its own tab without blocking, so their
+    network and render time overlaps; the tabs are then processed one at a time
+    because a WebDriver session only runs one command at a time. Metadata is
+    appended to image_metadata.jsonl once at the end.
+    
+    Returns:
+        List of newly saved metadata entries across all pages
+    """
+    logging.info("Starting browser for %d pages (%d tabs)", len(urls), max_tabs)
+    
+    dim_cache = load_dimension_cache(output_dir)
+    driver = get_driver(headless, remote_url)
+    collected_metadata = []
     
-    return new_metadata_entries
+    try:
+        handles = [driver.current_window_handle]
+        for _ in range(min(max_tabs, len(urls)) - 1):
+            driver.switch_to.new_window('tab')
+            handles.append(driver.current_window_handle)
+        
+        for start in range(0, len(urls), len(handles)):
+            batch = list(zip(handles, urls[start:start + len(handles)]))
+            
+            # Start every load without waiting for it to finish
+            for handle, url in batch:
+                logging.info("Loading: %s", url)
+                driver.switch_to.window(handle)
+                driver.execute_script(NAVIGATE_FROM_STALE_JS, url)
+            
+            # The tabs kept loading in parallel; each wait below returns as
+            # soon as that tab's new document has committed and gone quiet.
+            # Any failure only skips that URL, not the rest of the batch.
+            for handle, url in batch:
+                try:
+                    driver.switch_to.window(handle)
+                    # Without this the old document (about:blank or the tab's
+                    # previous page) could pass the quiet check and be scraped
+                    _wait_for_new_document(driver, wait_time)
+                    _wait_for_quiet(driver, wait_time)
+                    if scroll:
+                        logging.info("Scrolling page to load lazy images: %s", url)
+                        scroll_page(driver)
+                    image_urls, metadata_map, elementor_entries_list = _extract_page_images(
+                        driver, url, dim_cache, save_page_source
+                    )
+                except Exception as e:
+                    logging.warning("Failed to scrape %s: %s", url, e)
+                    continue
+                collected_metadata.extend(_build_metadata(image_urls, metadata_map, elementor_entries_list))
+    finally:
+        release_driver(driver, headless, remote_url)
+        save_dimension_cache(output_dir, dim_cache)
+    
+    return _save_metadata(output_dir, collected_metadata)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Scrape images from JavaScript-rendered webpages"
     )
-    parser.add_argument("url", help="URL to scrape images from")
+    parser.add_argument("urls", nargs="+", help="URL(s) to scrape images from")
     parser.add_argument(
         "--output-dir",
         "-o",
@@ -574,6 +1178,22 @@ def main():
         action="store_true",
         help="Disable automatic scrolling for lazy-loaded images"
     )
+    parser.add_argument(
+        "--max-tabs",
+        type=int,
+        default=4,
+        help="Pages loaded concurrently in browser tabs when scraping several URLs (default: 4)"
+    )
+    parser.add_argument(
+        "--save-page-source",
+        action="store_true",
+        help="Save the rendered page HTML to debug_output/ (always on at DEBUG level)"
+    )
+    parser.add_argument(
+        "--remote-url",
+        default=None,
+        help=f"Selenium server URL to run the browser on, e.g. http://localhost:4444 (default: ${REMOTE_URL_ENV})"
+    )
     parser.add_argument(
         "--show-browser",
         action="store_true",
@@ -594,21 +1214,35 @@ def main():
     
     output_path = Path(args.output_dir)
     
-    new_metadata = scrape_images_with_js(
-        args.url,
-        output_path,
-        keywords=args.keywords,
-        headless=not args.show_browser,
-        wait_time=args.wait_time,
-        scroll=not args.no_scroll,
-    )
+    if len(args.urls) == 1:
+        new_metadata = scrape_images_with_js(
+            args.urls[0],
+            output_path,
+            keywords=args.keywords,
+            headless=not args.show_browser,
+            wait_time=args.wait_time,
+            scroll=not args.no_scroll,
+            save_page_source=args.save_page_source,
+            remote_url=args.remote_url,
+        )
+    else:
+        new_metadata = scrape_images_with_js_batch(
+            args.urls,
+            output_path,
+            headless=not args.show_browser,
+            wait_time=args.wait_time,
+            scroll=not args.no_scroll,
+            max_tabs=args.max_tabs,
+            save_page_source=args.save_page_source,
+            remote_url=args.remote_url,
+        )
     
     print(f"\n{'='*60}")
     print(f"SCRAPING COMPLETE")
     print(f"{'='*60}")
-    print(f"Collected image metadata from page")
+    print(f"Collected image metadata from {len(args.urls)} page(s)")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
@@ -5,18 +5,90 @@ Scrape images from JavaScript-rendered pages using Selenium.
 """
 
 import argparse
-import json
 import logging
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+try:
+    from scripts.image_metadata_store import (
+        LEGACY_METADATA_FILENAME, METADATA_FILENAME, append_new_metadata, export_json,
+    )
+    from scripts.driver_pool import get_pooled_driver, release_pooled_driver
+except ModuleNotFoundError:  # Allows running as a standalone script
+    from image_metadata_store import (
+        LEGACY_METADATA_FILENAME, METADATA_FILENAME, append_new_metadata, export_json,
+    )
+    from driver_pool import get_pooled_driver, release_pooled_driver
+
+# Requests the scraper never needs: the report metadata and thumbnail URLs
+# come from the markup, so image, video and font downloads plus
+# analytics/tracking scripts are blocked. Stylesheets stay enabled so the
+# lazy-loaded report grid still lays out and triggers on scroll.
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*hotjar.com*', '*facebook.net*',
+]
+
+AUTHOR_CLASS_RE = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
+# Protocol of a CDN URL nested inside a wrapper URL ("https:/" or "https://")
+PROTOCOL_RE = re.compile(r'(https?:/+)')
+# Leading protocol with any number of slashes, normalized to exactly two
+LEADING_PROTOCOL_RE = re.compile(r'^(https?):/+')
+CLOUDFLARE_IMAGE_RE = re.compile(r'https?://[^/]+/cdn-cgi/image/[^/]+/(https?:/+/[^\s?]+)')
+SRCSET_ENTRY_RE = re.compile(r'(.+?)\s+(\d+)w\s*$')
+
+# Common image extensions (plus CDN "thumbnail" endpoints)
+IMAGE_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
+    '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
+)
+# Any of IMAGE_EXTENSIONS appearing in a query string (some CDNs use this)
+QUERY_IMAGE_EXT_RE = re.compile(r'\.(?:jpe?g|png|gif|webp|bmp|tiff?|heic|heif|avif|jfif)|thumbnail')
+
+# Report cards rendered by the gallery's JavaScript
+REPORT_ARTICLE_SELECTOR = 'article[data-template-type="report"]'
+# Limits the fallback page-source parse to the report articles
+REPORT_ARTICLE_STRAINER = SoupStrainer('article', attrs={'data-template-type': 'report'})
+
+# Reads the raw fields of every report article in the browser, mirroring
+# extract_supermetrics_report_metadata; texts follow get_text(strip=True)
+REPORT_CARDS_JS = """
+function strippedText(el) {
+    if (!el) { return ''; }
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    var text = '';
+    for (var node = walker.nextNode(); node; node = walker.nextNode()) {
+        text += node.nodeValue.trim();
+    }
+    return text;
+}
+return Array.from(document.querySelectorAll('article[data-template-type="report"]'), function(article) {
+    var link = article.querySelector('a[href]');
+    var picture = article.querySelector('picture');
+    var img = picture && picture.querySelector('img');
+    return {
+        href: link ? link.getAttribute('href') : '',
+        title: strippedText(link && link.querySelector('h3')),
+        source_srcsets: picture ? Array.from(picture.querySelectorAll('source[srcset]'), function(source) {
+            return source.getAttribute('srcset');
+        }) : [],
+        img_srcset: img ? (img.getAttribute('srcset') || '') : '',
+        img_src: img ? (img.getAttribute('src') || '') : ''
+    };
+});
+"""
 
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
@@ -28,37 +100,76 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-features=MediaRouter')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    # Return from driver.get at DOMContentLoaded; the explicit wait after it
+    # covers the report cards rendered by JavaScript
+    chrome_options.page_load_strategy = 'eager'
+    # Only the image URLs from src/srcset are needed, so never load image bytes
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     
     driver = webdriver.Chrome(options=chrome_options)
+    
+    # Block images, media, fonts and analytics at the network layer
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.debug(f"Failed to configure request blocking: {e}")
+    
     return driver
 
 
-def scroll_page(driver, scroll_pause: float = 2.0, max_scrolls: int = 10):
-    """Scroll page to trigger lazy loading."""
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    scrolls = 0
+def get_driver(headless: bool = True) -> webdriver.Chrome:
+    """Check out a pooled Chrome WebDriver, starting a new one if none is idle."""
+    return get_pooled_driver(setup_driver, headless)
+
+
+def release_driver(driver: webdriver.Chrome, headless: bool = True) -> None:
+    """Reset a driver's state and return it to the pool for reuse."""
+    release_pooled_driver(driver, setup_driver, headless)
+
+
+def scroll_page(driver, scroll_pause: float = 0.5, max_scrolls: int = 10, stable_scrolls: int = 2):
+    """
+    Scroll page to trigger lazy loading.
+    
+    Stops once the number of report articles has not grown for
+    stable_scrolls consecutive scrolls, rather than waiting for the page
+    height to settle.
+    """
+    count_js = f"return document.querySelectorAll('{REPORT_ARTICLE_SELECTOR}').length"
+    last_count = driver.execute_script(count_js)
+    unchanged = 0
     
-    while scrolls < max_scrolls:
+    for scrolls in range(1, max_scrolls + 1):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(scroll_pause)
         
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            break
-        last_height = new_height
-        scrolls += 1
-        logging.info("Scrolled %d times, page height: %d", scrolls, new_height)
+        new_count = driver.execute_script(count_js)
+        if new_count > last_count:
+            unchanged = 0
+            last_count = new_count
+        else:
+            unchanged += 1
+            if unchanged >= stable_scrolls:
+                break
+        logging.info("Scrolled %d times, report articles: %d", scrolls, new_count)
 
 
 def _get_nearby_text(element, max_chars: int = 240) -> str:
     """Extract nearby text content around an element."""
     texts = []
-    for sibling in element.find_all_next(string=True, limit=6):
+    total = 0
+    # Walk the next six strings directly instead of through find_all_next's filters
+    following = (node for node in element.next_elements if isinstance(node, NavigableString))
+    for sibling in islice(following, 6):
         stripped = sibling.strip()
         if stripped:
             texts.append(stripped)
-        if sum(len(t) for t in texts) >= max_chars:
+            total += len(stripped)
+        if total >= max_chars:
             break
     snippet = " ".join(texts).strip()
     return snippet[:max_chars] if snippet else ""
@@ -66,13 +177,12 @@ def _get_nearby_text(element, max_chars: int = 240) -> str:
 
 def _find_author(element):
     """Search ancestor tree for an author/byline-like element."""
-    author_patterns = re.compile(r"(author|byline|writer|posted-by)", re.IGNORECASE)
     for ancestor in element.parents:
         if ancestor is None:
             break
         if ancestor.name in ("body", "html"):
             break
-        for candidate in ancestor.find_all(True, class_=author_patterns):
+        for candidate in ancestor.find_all(True, class_=AUTHOR_CLASS_RE):
             text = candidate.get_text(strip=True)
             if text:
                 return text
@@ -108,7 +218,7 @@ def clean_thumbnail_url(url: str) -> str:
         before_domain = url[search_start:sanity_pos]
         
         # Find https?: or http?: pattern (with one or two slashes)
-        protocol_match = re.search(r'(https?:/+)', before_domain)
+        protocol_match = PROTOCOL_RE.search(before_domain)
         if protocol_match:
             # Get the start position relative to full URL
             protocol_start = search_start + protocol_match.start()
@@ -120,15 +230,15 @@ def clean_thumbnail_url(url: str) -> str:
             # Extract the URL
             clean_url = url[protocol_start:query_pos]
             # Fix protocol to always have exactly two slashes (https:/ -> https://, https:/// -> https://)
-            clean_url = re.sub(r'^(https?):/+', r'\1://', clean_url)
+            clean_url = LEADING_PROTOCOL_RE.sub(r'\1://', clean_url)
             return clean_url
     
     # Try Cloudflare CDN wrapper pattern
-    cloudflare_match = re.search(r'https?://[^/]+/cdn-cgi/image/[^/]+/(https?:/+/[^\s?]+)', url)
+    cloudflare_match = CLOUDFLARE_IMAGE_RE.search(url)
     if cloudflare_match:
         clean_url = cloudflare_match.group(1)
         # Fix protocol to always have exactly two slashes
-        clean_url = re.sub(r'^(https?):/+', r'\1://', clean_url)
+        clean_url = LEADING_PROTOCOL_RE.sub(r'\1://', clean_url)
         # Remove query parameters
         if '?' in clean_url:
             clean_url = clean_url.split('?')[0]
@@ -146,28 +256,86 @@ def has_image_extension(url: str) -> bool:
     if not url:
         return False
     
-    # Common image extensions
-    image_extensions = [
-        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp',
-        '.tiff', '.tif', '.heic', '.heif', '.avif', '.jfif', 'thumbnail'
-    ]
-    
     # Parse URL and check path
     parsed = urlparse(url)
     path = parsed.path.lower()
     
-    # Check if path ends with image extension
-    for ext in image_extensions:
-        if path.endswith(ext):
-            return True
+    # Check if path ends with image extension, then the query parameters
+    if path.endswith(IMAGE_EXTENSIONS):
+        return True
+    return QUERY_IMAGE_EXT_RE.search(parsed.query.lower()) is not None
+
+
+def _best_from_srcset(srcset: str) -> tuple:
+    """Return (width, url) of the widest "url NNNw" entry in srcset, or (0, None)."""
+    best = (0, None)
+    # srcset format: "url1 320w, url2 480w, ..."
+    for entry in srcset.split(','):
+        # Match: URL (may contain spaces) followed by space and number+w
+        match = SRCSET_ENTRY_RE.search(entry.strip())
+        if match and int(match.group(2)) > best[0]:
+            best = (int(match.group(2)), match.group(1).strip())
+    return best
+
+
+def _report_metadata(
+    base_url: str,
+    href: str,
+    title: str,
+    source_srcsets: list,
+    img_srcset: str,
+    img_src: str,
+) -> dict:
+    """
+    Build a report's metadata from the raw values of its article.
+    
+    Args:
+        base_url: URL of the page the article is on
+        href: href of the article's first link
+        title: Text of the <h3> inside that link
+        source_srcsets: srcset of each <source> in the article's <picture>
+        img_srcset: srcset of the <img> in the <picture>
+        img_src: src of the <img> in the <picture>
+    """
+    metadata = {
+        "thumbnail": "",
+        "source_link": "",
+        "title": title or "",
+        "author": "",
+        "extra_text": ""
+    }
+    
+    if href:
+        metadata["source_link"] = urljoin(base_url, href.strip())
     
-    # Also check query parameters for image extensions (some CDNs use this)
-    query = parsed.query.lower()
-    for ext in image_extensions:
-        if ext in query:
-            return True
+    # First try to get the highest resolution from srcset in <source> tags
+    _, best_url = max(
+        (_best_from_srcset(srcset) for srcset in source_srcsets),
+        key=lambda pair: pair[0],
+        default=(0, None),
+    )
     
-    return False
+    # If no srcset found, try the <img> srcset, then its src attribute
+    if not best_url and img_srcset:
+        _, best_url = _best_from_srcset(img_srcset)
+    if not best_url and img_src:
+        best_url = img_src.strip()
+    
+    if best_url:
+        # Clean up the URL - extract actual CDN URL from wrapper URLs
+        # This handles URLs like:
+        # "https://supermetrics.com/template-gallery/reporting-tools/format=avif/https:/cdn.sanity.io/images/...?w=1887&h=1975&fit=max"
+        best_url = clean_thumbnail_url(best_url)
+        
+        # Convert relative URLs to absolute
+        if best_url.startswith("/"):
+            metadata["thumbnail"] = urljoin(base_url, best_url)
+        elif best_url.startswith("http"):
+            metadata["thumbnail"] = best_url
+        else:
+            metadata["thumbnail"] = urljoin(base_url, best_url)
+    
+    return metadata
 
 
 def extract_supermetrics_report_metadata(article_tag, base_url: str) -> dict:
@@ -179,97 +347,44 @@ def extract_supermetrics_report_metadata(article_tag, base_url: str) -> dict:
       - <a href="source_link"><h3>title</h3></a>
       - <picture> with <source> and <img> tags for thumbnail
     """
-    metadata = {
-        "thumbnail": "",
-        "source_link": "",
-        "title": "",
-        "author": "",
-        "extra_text": ""
-    }
+    href = ""
+    title = ""
     
     # Extract title and source_link from <a><h3> structure
     link_tag = article_tag.find("a", href=True)
     if link_tag:
         href = link_tag.get("href", "")
-        if href:
-            metadata["source_link"] = urljoin(base_url, href.strip())
-        
         h3_tag = link_tag.find("h3")
         if h3_tag:
-            metadata["title"] = h3_tag.get_text(strip=True)
+            title = h3_tag.get_text(strip=True)
     
     # Extract thumbnail from <picture> tag
+    source_srcsets = []
+    img_srcset = ""
+    img_src = ""
     picture_tag = article_tag.find("picture")
     if picture_tag:
-        # First try to get the highest resolution from srcset in <source> tags
-        best_url = None
-        best_width = 0
-        
-        # Check all <source> tags for srcset
-        for source in picture_tag.find_all("source", srcset=True):
-            srcset = source.get("srcset", "")
-            # Parse srcset: "url1 320w, url2 480w, ..."
-            # Split by comma first, then parse each entry
-            for entry in srcset.split(','):
-                entry = entry.strip()
-                # Match: URL (may contain spaces) followed by space and number+w
-                match = re.search(r'(.+?)\s+(\d+)w\s*$', entry)
-                if match:
-                    url = match.group(1).strip()
-                    width_str = match.group(2)
-                    try:
-                        width = int(width_str)
-                        if width > best_width:
-                            best_width = width
-                            best_url = url
-                    except ValueError:
-                        continue
-        
-        # If no srcset found, try the <img> tag
-        if not best_url:
-            img_tag = picture_tag.find("img")
-            if img_tag:
-                # Try srcset first
-                img_srcset = img_tag.get("srcset", "")
-                if img_srcset:
-                    # Parse srcset: "url1 320w, url2 480w, ..."
-                    # Split by comma first, then parse each entry
-                    for entry in img_srcset.split(','):
-                        entry = entry.strip()
-                        # Match: URL (may contain spaces) followed by space and number+w
-                        match = re.search(r'(.+?)\s+(\d+)w\s*$', entry)
-                        if match:
-                            url = match.group(1).strip()
-                            width_str = match.group(2)
-                            try:
-                                width = int(width_str)
-                                if width > best_width:
-                                    best_width = width
-                                    best_url = url
-                            except ValueError:
-                                continue
-                
-                # Fall back to src attribute
-                if not best_url:
-                    img_src = img_tag.get("src", "")
-                    if img_src:
-                        best_url = img_src.strip()
-        
-        if best_url:
-            # Clean up the URL - extract actual CDN URL from wrapper URLs
-            # This handles URLs like:
-            # "https://supermetrics.com/template-gallery/reporting-tools/format=avif/https:/cdn.sanity.io/images/...?w=1887&h=1975&fit=max"
-            best_url = clean_thumbnail_url(best_url)
-            
-            # Convert relative URLs to absolute
-            if best_url.startswith("/"):
-                metadata["thumbnail"] = urljoin(base_url, best_url)
-            elif best_url.startswith("http"):
-                metadata["thumbnail"] = best_url
-            else:
-                metadata["thumbnail"] = urljoin(base_url, best_url)
+        source_srcsets = [source.get("srcset", "") for source in picture_tag.find_all("source", srcset=True)]
+        img_tag = picture_tag.find("img")
+        if img_tag:
+            img_srcset = img_tag.get("srcset", "")
+            img_src = img_tag.get("src", "")
     
-    return metadata
+    return _report_metadata(base_url, href, title, source_srcsets, img_srcset, img_src)
+
+
+def harvest_report_cards(driver) -> list:
+    """
+    Read every report article's raw fields in the browser with one script.
+    
+    Returns a list of keyword dicts for _report_metadata, or an empty list
+    if the page has no report articles or the script fails.
+    """
+    try:
+        return driver.execute_script(REPORT_CARDS_JS) or []
+    except Exception as e:
+        logging.debug(f"Failed to harvest report cards in the browser: {e}")
+        return []
 
 
 def extract_image_metadata(img_tag, base_url: str) -> dict:
@@ -314,6 +429,95 @@ def extract_image_metadata(img_tag, base_url: str) -> dict:
     return metadata
 
 
+def _save_page_source(page_source: str) -> None:
+    """Write the rendered HTML to a timestamped file in debug_output/."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    debug_dir = Path("debug_output")
+    debug_dir.mkdir(exist_ok=True)
+    page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
+    
+    try:
+        page_source_file.write_bytes(page_source.encode('utf-8', 'replace'))
+        logging.info(f"Saved page source to: {page_source_file}")
+    except Exception as e:
+        logging.warning(f"Failed to save page source: {e}")
+
+
+def _scrape_reports(driver: webdriver.Chrome, url: str, wait_time: int, scroll: bool) -> list:
+    """Load url in the driver and return the metadata of its report articles."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
+    driver.get(url)
+    
+    logging.info("Waiting up to %d seconds for report articles to render...", wait_time)
+    try:
+        WebDriverWait(driver, wait_time).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, REPORT_ARTICLE_SELECTOR))
+        )
+    except TimeoutException:
+        logging.warning("No report articles appeared on %s within %d seconds, continuing anyway", url, wait_time)
+    
+    if scroll:
+        logging.info("Scrolling page to load lazy images...")
+        scroll_page(driver)
+    
+    # The page source is only transferred when it is dumped or parsed
+    page_source = None
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        page_source = driver.page_source
+        _save_page_source(page_source)
+    
+    # Fast path: read the report articles in the browser in one call and
+    # ship back only their fields; parse the page source if that fails
+    cards = harvest_report_cards(driver)
+    if cards:
+        logging.info("Harvested %d report articles in the browser", len(cards))
+        article_count = len(cards)
+        metas = (_report_metadata(url, **card) for card in cards)
+    else:
+        if page_source is None:
+            page_source = driver.page_source
+        # Report metadata only ever reads inside the article, so build the
+        # tree for the report articles alone instead of the whole page
+        soup = BeautifulSoup(page_source, 'lxml', parse_only=REPORT_ARTICLE_STRAINER)
+        
+        # Supermetrics-specific: Find all report articles
+        articles = soup.find_all('article', {'data-template-type': 'report'})
+        logging.info("Found %d report articles", len(articles))
+        article_count = len(articles)
+        metas = (extract_supermetrics_report_metadata(article, url) for article in articles)
+    
+    collected_metadata = []
+    for idx, meta in enumerate(metas, 1):
+        logging.debug("Processing article %d/%d", idx, article_count)
+        
+        # Only add if we have at least a thumbnail or title
+        if meta.get("thumbnail") or meta.get("title"):
+            collected_metadata.append(meta)
+            logging.debug(
+                "Extracted: title='%s', source_link='%s', thumbnail='%s'",
+                meta.get("title", ""),
+                meta.get("source_link", ""),
+                meta.get("thumbnail", "")
+            )
+        else:
+            logging.warning("Skipping article %d - no thumbnail or title found", idx)
+    
+    logging.info("Collected metadata for %d reports", len(collected_metadata))
+    return collected_metadata
+
+
+def _save_metadata(output_dir: Path, collected_metadata: list) -> list:
+    """Append new collected metadata to image_metadata.jsonl; returns the newly added entries."""
+    if not collected_metadata:
+        logging.info("No additional metadata collected for images.")
+        return []
+    return append_new_metadata(output_dir, collected_metadata)
+
+
 def scrape_images_with_js(
     url: str,
     output_dir: Path,
@@ -321,6 +525,7 @@ def scrape_images_with_js(
     headless: bool = True,
     wait_time: int = 5,
     scroll: bool = True,
+    driver: webdriver.Chrome = None,
 ) -> list:
     """
     Scrape report metadata from Supermetrics pages.
@@ -335,125 +540,81 @@ def scrape_images_with_js(
         output_dir: Directory to save metadata
         keywords: (Unused - kept for backwards compatibility)
         headless: Run browser in headless mode
-        wait_time: Seconds to wait for JavaScript to load
+        wait_time: Maximum seconds to wait for the report articles to render
         scroll: Whether to scroll page for lazy-loaded images
+        driver: Browser to use; the caller keeps ownership. Defaults to a
+            pooled driver that stays open until the process exits
     
     Returns:
         List of metadata dictionaries with title, source_link, and thumbnail
     """
+    if driver is not None:
+        logging.info("Loading: %s", url)
+        collected_metadata = _scrape_reports(driver, url, wait_time, scroll)
+        return _save_metadata(output_dir, collected_metadata)
+    
     logging.info("Starting browser and loading: %s", url)
     
-    driver = setup_driver(headless)
+    driver = get_driver(headless)
     
     try:
-        driver.get(url)
-        
-        logging.info("Waiting %d seconds for JavaScript to load...", wait_time)
-        time.sleep(wait_time)
-        
-        if scroll:
-            logging.info("Scrolling page to load lazy images...")
-            scroll_page(driver)
-        
-        page_source = driver.page_source
-        
-        # Save page source for debugging
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_dir = Path("debug_output")
-        debug_dir.mkdir(exist_ok=True)
-        page_source_file = debug_dir / f"scrape_page_source_{timestamp}.html"
-        
-        try:
-            with open(page_source_file, 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            logging.info(f"Saved page source to: {page_source_file}")
-        except Exception as e:
-            logging.warning(f"Failed to save page source: {e}")
-        
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # Supermetrics-specific: Find all report articles
-        collected_metadata = []
-        articles = soup.find_all('article', {'data-template-type': 'report'})
-        logging.info("Found %d report articles", len(articles))
-        
-        for idx, article in enumerate(articles, 1):
-            logging.info("Processing article %d/%d", idx, len(articles))
-            meta = extract_supermetrics_report_metadata(article, url)
-            
-            # Only add if we have at least a thumbnail or title
-            if meta.get("thumbnail") or meta.get("title"):
-                collected_metadata.append(meta)
-                logging.debug(
-                    "Extracted: title='%s', source_link='%s', thumbnail='%s'",
-                    meta.get("title", ""),
-                    meta.get("source_link", ""),
-                    meta.get("thumbnail", "")
-                )
-            else:
-                logging.warning("Skipping article %d - no thumbnail or title found", idx)
-        
-        logging.info("Collected metadata for %d reports", len(collected_metadata))
-        
+        collected_metadata = _scrape_reports(driver, url, wait_time, scroll)
     finally:
-        driver.quit()
+        release_driver(driver, headless)
     
-    output_dir.mkdir(parents=True, exist_ok=True)
+    return _save_metadata(output_dir, collected_metadata)
+
+
+def _scrape_url_with_pooled_driver(url: str, headless: bool, wait_time: int, scroll: bool) -> list:
+    """Scrape one page with a pooled browser; returns [] if the page fails."""
+    logging.info("Loading: %s", url)
+    driver = get_driver(headless)
+    try:
+        return _scrape_reports(driver, url, wait_time, scroll)
+    except Exception as e:
+        logging.warning("Failed to scrape %s: %s", url, e)
+        return []
+    finally:
+        release_driver(driver, headless)
+
+
+def scrape_images_with_js_batch(
+    urls: list,
+    output_dir: Path,
+    headless: bool = True,
+    wait_time: int = 5,
+    scroll: bool = True,
+    workers: int = 4,
+) -> list:
+    """
+    Scrape several Supermetrics pages concurrently, one browser per worker.
     
-    new_metadata_entries = []
+    A WebDriver session is not thread-safe, so each page checks out its own
+    pooled browser; the page loads, waits and scrolls overlap across workers
+    and browsers are reused for later pages instead of restarted.
+    Metadata is appended to image_metadata.jsonl once at the end, in URL order.
     
-    if collected_metadata:
-        metadata_path = output_dir / "image_metadata.json"
-        existing_metadata = []
-        existing_urls = set()
-        
-        if metadata_path.exists():
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    existing_metadata = json.load(f)
-                for item in existing_metadata:
-                    if isinstance(item, dict):
-                        url = item.get("thumbnail")
-                        if url:
-                            existing_urls.add(url)
-                logging.info("Loaded %d existing metadata entries", len(existing_metadata))
-            except Exception as exc:
-                logging.warning("Failed to read existing metadata JSON: %s", exc)
-                existing_metadata = []
-                existing_urls = set()
-        
-        combined_metadata = list(existing_metadata)
-        for meta in collected_metadata:
-            url = meta.get("thumbnail")
-            if url and url in existing_urls:
-                continue
-            combined_metadata.append(meta)
-            if url:
-                existing_urls.add(url)
-            new_metadata_entries.append(meta)
-        
-        try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(combined_metadata, f, ensure_ascii=False, indent=2)
-            logging.info(
-                "Saved metadata for %d new images (total %d) to %s",
-                len(new_metadata_entries),
-                len(combined_metadata),
-                metadata_path,
-            )
-        except Exception as exc:
-            logging.warning("Failed to save metadata JSON: %s", exc)
-    else:
-        logging.info("No additional metadata collected for images.")
+    Returns:
+        List of newly saved metadata entries across all pages
+    """
+    logging.info("Scraping %d pages with %d workers", len(urls), workers)
+    
+    collected_metadata = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+        for page_metadata in executor.map(
+            lambda page_url: _scrape_url_with_pooled_driver(page_url, headless, wait_time, scroll),
+            urls,
+        ):
+            collected_metadata.extend(page_metadata)
     
-    return new_metadata_entries
+    return _save_metadata(output_dir, collected_metadata)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Scrape report metadata from Supermetrics pages (titles, source links, thumbnails)"
     )
-    parser.add_argument("url", help="URL to scrape images from")
+    parser.add_argument("urls", nargs="+", help="URL(s) to scrape images from")
     parser.add_argument(
         "--output-dir",
         "-o",
@@ -471,13 +632,25 @@ def main():
         "--wait-time",
         type=int,
         default=10,
-        help="Seconds to wait for JavaScript to load (default: 10)"
+        help="Maximum seconds to wait for report articles to render (default: 10)"
     )
     parser.add_argument(
         "--no-scroll",
         action="store_true",
         help="Disable automatic scrolling for lazy-loaded images"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Pages scraped concurrently, each in its own browser, when scraping several URLs (default: 4)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=f"After scraping, export every entry in {METADATA_FILENAME} as the pretty {LEGACY_METADATA_FILENAME} array "
+             f"(newer entries in {LEGACY_METADATA_FILENAME} are merged in first; {METADATA_FILENAME} is not rewritten)"
+    )
     parser.add_argument(
         "--show-browser",
         action="store_true",
@@ -498,21 +671,38 @@ def main():
     
     output_path = Path(args.output_dir)
     
-    new_metadata = scrape_images_with_js(
-        args.url,
-        output_path,
-        keywords=args.keywords,
-        headless=not args.show_browser,
-        wait_time=args.wait_time,
-        scroll=not args.no_scroll,
-    )
+    if len(args.urls) == 1:
+        new_metadata = scrape_images_with_js(
+            args.urls[0],
+            output_path,
+            keywords=args.keywords,
+            headless=not args.show_browser,
+            wait_time=args.wait_time,
+            scroll=not args.no_scroll,
+        )
+    else:
+        new_metadata = scrape_images_with_js_batch(
+            args.urls,
+            output_path,
+            headless=not args.show_browser,
+            wait_time=args.wait_time,
+            scroll=not args.no_scroll,
+            workers=args.workers,
+        )
+    
+    if args.compact:
+        try:
+            count = export_json(output_path)
+            logging.info("Exported %d metadata entries to %s", count, output_path / LEGACY_METADATA_FILENAME)
+        except Exception as exc:
+            logging.warning("Failed to export metadata JSON: %s", exc)
     
     print(f"\n{'='*60}")
     print(f"SCRAPING COMPLETE")
     print(f"{'='*60}")
-    print(f"Collected image metadata from page")
+    print(f"Collected image metadata from {len(args.urls)} page(s)")
     print(f"New metadata entries saved: {len(new_metadata)}")
-    print(f"Metadata file: {(output_path / 'image_metadata.json').absolute()}")
+    print(f"Metadata file: {(output_path / METADATA_FILENAME).absolute()}")
     print(f"{'='*60}")
     
     if new_metadata:
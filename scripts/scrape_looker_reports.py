@@ -1,10 +1,11 @@
 import argparse
 import ast
 import json
+import mmap
 import re
 import sys
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 try:
     import requests
@@ -15,25 +16,119 @@ except ImportError as exc:  # pragma: no cover - requests should be available, b
 REPORTS_LIST_MARKER = "reportsList:["
 THUMBNAIL_TEMPLATE = "https://datastudio.google.com/reporting/{report_id}/thumbnail?sz=w320-h240-p-k-nu"
 STRING_ESCAPE_PATTERN = re.compile(r"\\u[0-9a-fA-F]{4}")
+# Structural tokens of a JS source: whole string literals (escapes included)
+# and brackets/braces, so scanners only visit the characters that matter
+JS_TOKEN_PATTERN = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*"'
+    r"|'[^'\\]*(?:\\.[^'\\]*)*'"
+    r"|[\[\]{}]",
+    re.DOTALL,
+)
+# Byte-level variant of JS_TOKEN_PATTERN for scanning a download as it arrives.
+# The closing quote is optional (captured) so a string literal cut off at the
+# end of the buffer can be told apart from a complete one.
+JS_STREAM_TOKEN_PATTERN = re.compile(
+    rb'"[^"\\]*(?:\\.[^"\\]*)*("?)'
+    rb"|'[^'\\]*(?:\\.[^'\\]*)*('?)"
+    rb"|[\[\]{}]",
+    re.DOTALL,
+)
+STREAM_CHUNK_SIZE = 64 * 1024
+# Escapes and bare double quotes inside a single-quoted JS string body
+SINGLE_QUOTED_ESCAPE_PATTERN = re.compile(r"\\(.)|\"", re.DOTALL)
 
 
 class ReportsParseError(RuntimeError):
     """Raised when the reports list cannot be parsed from the JS payload."""
 
 
-def fetch_js(source: str, timeout: float = 30.0) -> str:
-    """Download the Looker gallery JavaScript bundle or read it from disk."""
+def fetch_js(source: str, timeout: float = 30.0, session: Optional["requests.Session"] = None) -> str:
+    """Download the Looker gallery JavaScript bundle or read it from disk.
+
+    Pass ``session`` to reuse a caller's pooled connections for the download.
+    """
     path_candidate = Path(source)
     if path_candidate.exists():
-        return path_candidate.read_text(encoding="utf-8")
+        return _read_local_js(path_candidate)
 
     if source.startswith("file://"):
-        return Path(source[7:]).read_text(encoding="utf-8")
+        return _read_local_js(Path(source[7:]))
+
+    http = session if session is not None else requests
+    with http.get(source, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        encoding = response.encoding or "utf-8"
+        buffer = _download_until_reports_end(response)
+    return buffer.decode(encoding, errors="replace")
 
-    response = requests.get(source, timeout=timeout)
-    response.raise_for_status()
-    response.encoding = response.encoding or "utf-8"
-    return response.text
+
+def _read_local_js(path: Path) -> str:
+    """Read a bundle from disk, decoding only up to the end of reportsList.
+
+    The file is memory-mapped and scanned as bytes, so the OS pages in just
+    the part before the closing bracket and the tail is never decoded.
+    """
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return ""
+    with mapped:
+        marker_index = mapped.find(REPORTS_LIST_MARKER.encode("utf-8"))
+        end = len(mapped)
+        if marker_index != -1:
+            array_start = marker_index + len(REPORTS_LIST_MARKER) - 1
+            position, _, closed = _scan_reports_array(mapped, array_start, 0)
+            if closed:
+                end = position
+        return mapped[:end].decode("utf-8")
+
+
+def _scan_reports_array(buffer: bytes, position: int, depth: int) -> Tuple[int, int, bool]:
+    """Advance the bracket depth over ``buffer`` starting at ``position``.
+
+    Returns the position to resume from, the current depth and whether the
+    reportsList array has been closed. Scanning stops before a string literal
+    that is still incomplete so it is re-read once more bytes arrive.
+    """
+    for match in JS_STREAM_TOKEN_PATTERN.finditer(buffer, position):
+        token = match.group()
+        if token[0] in b"\"'":
+            if match.group(1) == b"" or match.group(2) == b"":
+                return match.start(), depth, False
+            continue
+        if token in (b"[", b"{"):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end(), depth, True
+    return len(buffer), depth, False
+
+
+def _download_until_reports_end(response) -> bytearray:
+    """Read the streamed bundle only until the reportsList array is closed."""
+    marker = REPORTS_LIST_MARKER.encode("utf-8")
+    buffer = bytearray()
+    array_start = -1
+    position = 0
+    depth = 0
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        if not chunk:
+            continue
+        search_from = max(0, len(buffer) - len(marker) + 1)
+        buffer.extend(chunk)
+        if array_start == -1:
+            marker_index = buffer.find(marker, search_from)
+            if marker_index == -1:
+                continue
+            array_start = marker_index + len(marker) - 1
+            position = array_start
+        position, depth, closed = _scan_reports_array(buffer, position, depth)
+        if closed:
+            del buffer[position:]
+            break
+    return buffer
 
 
 def extract_reports_array(js_source: str) -> str:
@@ -42,68 +137,56 @@ def extract_reports_array(js_source: str) -> str:
     if marker_index == -1:
         raise ReportsParseError("Unable to locate 'reportsList' marker in JS payload")
 
-    array_start = js_source.find("[", marker_index)
-    if array_start == -1:
-        raise ReportsParseError("Unable to find opening '[' for reportsList")
+    # The marker ends with the array's opening bracket
+    array_start = marker_index + len(REPORTS_LIST_MARKER) - 1
 
     depth = 0
-    in_string = False
-    string_quote = ""
-    escape = False
-
-    for index in range(array_start, len(js_source)):
-        char = js_source[index]
-        if in_string:
-            if escape:
-                escape = False
-            elif char == "\\":
-                escape = True
-            elif char == string_quote:
-                in_string = False
-        else:
-            if char in ('"', "'"):
-                in_string = True
-                string_quote = char
-            elif char == "[":
-                depth += 1
-            elif char == "]":
-                depth -= 1
-                if depth == 0:
-                    return js_source[array_start : index + 1]
+    for match in JS_TOKEN_PATTERN.finditer(js_source, array_start):
+        token = match.group()
+        if token == "[":
+            depth += 1
+        elif token == "]":
+            depth -= 1
+            if depth == 0:
+                return js_source[array_start : match.end()]
     raise ReportsParseError("Unable to find closing ']' for reportsList array")
 
 
 def iter_object_literals(array_src: str) -> Iterable[str]:
     depth = 0
     start = None
-    in_string = False
-    string_quote = ""
-    escape = False
-
-    for index, char in enumerate(array_src):
-        if in_string:
-            if escape:
-                escape = False
-            elif char == "\\":
-                escape = True
-            elif char == string_quote:
-                in_string = False
-        else:
-            if char in ('"', "'"):
-                in_string = True
-                string_quote = char
-            elif char == "{":
-                if depth == 0:
-                    start = index
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0 and start is not None:
-                    yield array_src[start : index + 1]
-                    start = None
+
+    for match in JS_TOKEN_PATTERN.finditer(array_src):
+        token = match.group()
+        if token == "{":
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0 and start is not None:
+                yield array_src[start : match.end()]
+                start = None
     return []
 
 
+def _normalize_single_quoted_escape(match: re.Match) -> str:
+    escaped = match.group(1)
+    if escaped is None:
+        return '\\"'
+    if escaped == "'":
+        return "'"
+    return match.group()
+
+
+def _to_json_string_literal(literal: str) -> str:
+    """Rewrite a single-quoted JS string literal with double quotes."""
+    if literal[0] == '"':
+        return literal
+    body = SINGLE_QUOTED_ESCAPE_PATTERN.sub(_normalize_single_quoted_escape, literal[1:-1])
+    return f'"{body}"'
+
+
 def extract_string_field(obj_src: str, key: str) -> Optional[str]:
     key_pattern = f"{key}:"
     pos = obj_src.find(key_pattern)
@@ -116,28 +199,22 @@ def extract_string_field(obj_src: str, key: str) -> Optional[str]:
     if index >= len(obj_src) or obj_src[index] not in ('"', "'"):
         return None
 
-    quote = obj_src[index]
-    value_start = index
-    index += 1
-    escape = False
-
-    while index < len(obj_src):
-        char = obj_src[index]
-        if escape:
-            escape = False
-        elif char == "\\":
-            escape = True
-        elif char == quote:
-            literal = obj_src[value_start : index + 1]
-            try:
-                value = ast.literal_eval(literal)
-            except SyntaxError as exc:  # pragma: no cover - unlikely but guard anyway
-                raise ReportsParseError(f"Unable to decode string for key '{key}'") from exc
-            if isinstance(value, str):
-                value = value.encode("utf-16", "surrogatepass").decode("utf-16")
-            return value
-        index += 1
-    return None
+    # Match the whole string literal from its opening quote
+    match = JS_TOKEN_PATTERN.match(obj_src, index)
+    if match is None:
+        return None
+    literal = match.group()
+    try:
+        return json.loads(_to_json_string_literal(literal))
+    except json.JSONDecodeError:
+        pass
+    try:
+        value = ast.literal_eval(literal)
+    except SyntaxError as exc:  # pragma: no cover - unlikely but guard anyway
+        raise ReportsParseError(f"Unable to decode string for key '{key}'") from exc
+    if isinstance(value, str):
+        value = value.encode("utf-16", "surrogatepass").decode("utf-16")
+    return value
 
 
 def parse_reports(js_array_src: str) -> List[dict]:
@@ -238,13 +315,14 @@ def main(
     indent: int = 2,
     timeout: float = 30.0,
     write_output: bool = True,
+    session: Optional["requests.Session"] = None,
 ) -> List[dict]:
     """
     Scrape Looker Studio gallery metadata.
 
     When called from the command line, provide ``argv`` so argparse handles the CLI
     flags. When used programmatically, pass ``js_url`` (and optionally ``output_path``,
-    ``indent``, ``timeout`` and ``write_output``) and omit ``argv``.
+    ``indent``, ``timeout``, ``write_output`` and a requests ``session``) and omit ``argv``.
     """
     if argv is not None:
         args = parse_args(argv)
@@ -260,7 +338,7 @@ def main(
             output_path = Path(output_path)
 
     try:
-        js_source = fetch_js(js_url, timeout=timeout)
+        js_source = fetch_js(js_url, timeout=timeout, session=session)
         reports_array_src = extract_reports_array(js_source)
         reports_raw = parse_reports(reports_array_src)
         reports = transform_reports(reports_raw)
@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Iterable, List, Optional, Sequence
@@ -6,7 +7,9 @@ from urllib.parse import urljoin
 import os
 import json
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -34,7 +37,21 @@ DEFAULT_HEADERS = {
 
 REQUEST_TIMEOUT = 20
 
+# Shared keep-alive session for every HTTP call made by the scrapers; other
+# modules can import it so connections to the same hosts are reused
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_RETRY))
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_RETRY))
+
 TABLEAU_BASE = "https://public.tableau.com"
+# JSON endpoint behind the Tableau Public viz search page
+TABLEAU_SEARCH_API = f"{TABLEAU_BASE}/api/search/query"
+TABLEAU_PAGE_SIZE = 20
+TABLEAU_MAX_WORKERS = 8
+# Only the gallery cards are read from the Selenium page source
+VIZCARD_STRAINER = SoupStrainer("div", attrs={"data-testid": "VizCard"})
 # WINDSOR_TEMPLATE_PAGES: Sequence[str] = [
 #     "https://www.catchr.io/template"
 # ]
@@ -198,6 +215,14 @@ class WindsorTemplate:
         return asdict(self)
 
 
+def _parse_html(markup: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse markup with lxml, falling back to html.parser if lxml is missing."""
+    try:
+        return BeautifulSoup(markup, "lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, "html.parser", parse_only=parse_only)
+
+
 def _absolute_url(base: str, candidate: Optional[str]) -> str:
     if not candidate:
         return base
@@ -209,7 +234,95 @@ def _absolute_url(base: str, candidate: Optional[str]) -> str:
 # --------------------------------------------------------------------------------------
 
 
+class TableauAPIError(RuntimeError):
+    """Raised when the Tableau Public search API fails or changes shape."""
+
+
+def _tableau_result_from_workbook(workbook: dict) -> Optional[dict]:
+    workbook_repo_url = workbook.get("workbookRepoUrl")
+    profile_name = workbook.get("authorProfileName")
+    if not workbook_repo_url or not profile_name:
+        return None
+
+    # defaultViewRepoUrl looks like "<workbook>/sheets/<view>"
+    default_view = workbook.get("defaultViewRepoUrl") or ""
+    view_name = default_view.rsplit("/", 1)[-1] if "/sheets/" in default_view else ""
+    viz_path = f"{workbook_repo_url}/{view_name}" if view_name else workbook_repo_url
+
+    return {
+        "title": (workbook.get("title") or "").strip() or "Unknown",
+        "author": (workbook.get("authorDisplayName") or profile_name).strip() or "Unknown",
+        "sourceUrl": f"{TABLEAU_BASE}/app/profile/{profile_name}/viz/{viz_path}",
+        "thumbnail": f"{TABLEAU_BASE}/thumb/views/{viz_path}" if view_name else "",
+    }
+
+
+def _fetch_tableau_api_page(query: str, page_number: int) -> List[dict]:
+    """Return the result dicts for one page of the Tableau Public search API."""
+    params = {
+        "count": TABLEAU_PAGE_SIZE,
+        "language": "en-us",
+        "query": query,
+        "start": (page_number - 1) * TABLEAU_PAGE_SIZE,
+        "type": "vizzes",
+    }
+    try:
+        response = SESSION.get(TABLEAU_SEARCH_API, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
+    except (requests.RequestException, ValueError) as exc:
+        raise TableauAPIError(f"search request failed: {exc}") from exc
+
+    items = payload.get("results") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise TableauAPIError("unexpected search response schema")
+
+    workbooks = [item.get("workbook") for item in items if isinstance(item, dict)]
+    workbooks = [workbook for workbook in workbooks if isinstance(workbook, dict)]
+    if items and not workbooks:
+        raise TableauAPIError("unexpected search result schema")
+
+    results: List[dict] = []
+    for workbook in workbooks:
+        result = _tableau_result_from_workbook(workbook)
+        if result:
+            results.append(result)
+    return results
+
+
 def get_tableau_dashboards(query: str, num_results: int = 10, max_pages: int = 5) -> List[dict]:
+    """
+    Fetch Tableau Public search results for the supplied query from the JSON
+    search API, falling back to Selenium if the API fails or changes shape.
+
+    Pages are independent, so the pages still needed are fetched
+    concurrently and merged in page order.
+    """
+    results: List[dict] = []
+    next_page = 1
+    try:
+        while len(results) < num_results and next_page <= max_pages:
+            pages_needed = -(-(num_results - len(results)) // TABLEAU_PAGE_SIZE)
+            page_numbers = range(next_page, min(max_pages, next_page + pages_needed - 1) + 1)
+            next_page = page_numbers[-1] + 1
+            with ThreadPoolExecutor(max_workers=min(len(page_numbers), TABLEAU_MAX_WORKERS)) as executor:
+                pages = list(executor.map(lambda n: _fetch_tableau_api_page(query, n), page_numbers))
+            exhausted = False
+            for page_results in pages:
+                if not page_results:
+                    exhausted = True
+                    break
+                results.extend(page_results)
+            if exhausted:
+                break
+    except TableauAPIError as exc:
+        print(f"Tableau: API {exc}; falling back to Selenium.")
+        return _get_tableau_dashboards_selenium(query, num_results=num_results, max_pages=max_pages)
+
+    return results[:num_results]
+
+
+def _get_tableau_dashboards_selenium(query: str, num_results: int = 10, max_pages: int = 5) -> List[dict]:
     """
     Scrape Tableau Public search results for the supplied query using headless
     Selenium so we can capture dynamically rendered gallery cards.
@@ -251,8 +364,8 @@ def get_tableau_dashboards(query: str, num_results: int = 10, max_pages: int = 5
                 print(f"Tableau: no viz cards found on page {page_number} for query '{query}'.")
                 break
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            viz_cards = soup.select('div[data-testid="VizCard"]')
+            soup = _parse_html(driver.page_source, parse_only=VIZCARD_STRAINER)
+            viz_cards = soup.find_all("div", attrs={"data-testid": "VizCard"})
 
             for viz_card in viz_cards:
                 link_elem = viz_card.find("a", attrs={"href": True})
@@ -307,6 +420,7 @@ def _fetch_looker_reports(query: str = "") -> List[dict]:
             indent=2,
             timeout=30.0,
             write_output=True,
+            session=SESSION,
         )
     except Exception as exc:
         print(f"Looker Studio: scraper execution failed: {exc}")